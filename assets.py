@@ -0,0 +1,126 @@
+"""Responsive image variants for ``st.image``.
+
+Source images are re-encoded as WebP at the widths the layout actually uses and
+written under content-hashed names in ``.assets/``. At runtime ``image`` picks
+the smallest variant that covers the column and serves it from an in-process
+byte cache, so reruns only ``stat`` the source file.
+
+Variants are generated lazily on first use; ``python assets.py build`` generates
+all of them ahead of a deploy.
+"""
+
+import hashlib
+import io
+import os
+import sys
+
+try:
+    from PIL import Image
+except ImportError:  # serve the original files untouched
+    Image = None
+
+import atomic
+import perf
+from byte_cache import ByteCache
+
+BUILD_DIR = os.environ.get("PORTFOLIO_ASSET_DIR", ".assets")
+VARIANT_WIDTHS = [480, 720, 960, 1440]
+# Widest main column in the "wide" layout (CSS px) and the pixel density we serve for.
+LAYOUT_WIDTH = 1600
+PIXEL_RATIO = 1.5
+WEBP_QUALITY = 82
+CACHE_BYTES = int(os.environ.get("PORTFOLIO_ASSET_CACHE_BYTES", 64 * 1024 * 1024))
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg")
+
+_cache = ByteCache(CACHE_BYTES)
+_digests = {}
+
+
+def _source_digest(path, stat):
+    key = (path, stat.st_mtime_ns, stat.st_size)
+    digest = _digests.get(key)
+    if digest is None:
+        with open(path, "rb") as handle:
+            digest = hashlib.sha1(handle.read()).hexdigest()[:12]
+        _digests[key] = digest
+    return digest
+
+
+def variant_width(fraction):
+    """Smallest variant width that fills a column taking ``fraction`` of the layout."""
+    target = LAYOUT_WIDTH * fraction * PIXEL_RATIO
+    for width in VARIANT_WIDTHS:
+        if width >= target:
+            return width
+    return VARIANT_WIDTHS[-1]
+
+
+def variant_path(path, digest, width):
+    stem = os.path.splitext(os.path.basename(path))[0].replace(" ", "_")
+    return os.path.join(BUILD_DIR, f"{stem}.{digest}.{width}.webp")
+
+
+def _encode(path, width, target):
+    with Image.open(path) as source:
+        if source.width > width:
+            source = source.resize((width, round(source.height * width / source.width)), Image.LANCZOS)
+        if source.mode not in ("RGB", "RGBA"):
+            has_alpha = "A" in source.mode or "transparency" in source.info
+            source = source.convert("RGBA" if has_alpha else "RGB")
+        buffer = io.BytesIO()
+        source.save(buffer, format="WEBP", quality=WEBP_QUALITY, method=6)
+    data = buffer.getvalue()
+    atomic.write_bytes(target, data)
+    return data
+
+
+def _load(path, stat, width):
+    if Image is None:
+        with open(path, "rb") as handle:
+            return handle.read()
+    target = variant_path(path, _source_digest(path, stat), width)
+    try:
+        with open(target, "rb") as handle:
+            return handle.read()
+    except FileNotFoundError:
+        return _encode(path, width, target)
+
+
+def image(path, fraction=1.0):
+    """Return bytes of the best variant of ``path`` for a column of width ``fraction``."""
+    stat = os.stat(path)
+    width = variant_width(fraction)
+    key = (path, stat.st_mtime_ns, stat.st_size, width)
+    data = _cache.get(key)
+    if data is not None:
+        perf.count("assets.hit")
+        return data
+    perf.count("assets.miss")
+    data = _load(path, stat, width)
+    _cache.put(key, data)
+    return data
+
+
+def build(root="."):
+    """Generate every variant for every image under ``root``; returns the number written."""
+    written = 0
+    for name in sorted(os.listdir(root)):
+        if not name.lower().endswith(IMAGE_EXTENSIONS):
+            continue
+        path = os.path.join(root, name)
+        digest = _source_digest(path, os.stat(path))
+        for width in VARIANT_WIDTHS:
+            target = variant_path(path, digest, width)
+            if not os.path.exists(target):
+                _encode(path, width, target)
+                written += 1
+    return written
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2 or sys.argv[1] != "build":
+        sys.exit("usage: python assets.py build [root]")
+    if Image is None:
+        sys.exit("Pillow is required to build image variants")
+    count = build(sys.argv[2] if len(sys.argv) > 2 else ".")
+    print(f"Wrote {count} image variants to {BUILD_DIR}/")
@@ -0,0 +1,38 @@
+"""Atomic file writes for the on-disk stores and caches.
+
+The new contents are written to a temporary file next to the target and swapped
+in with ``os.replace``, so readers see either the old file or the new one,
+never a partial write. Temporary names are unique per write rather than per
+process, because Streamlit serves every session from threads of one process and
+two of them may write the same file at once; the last rename wins.
+"""
+
+import os
+import tempfile
+
+TMP_SUFFIX = ".tmp"
+
+
+def write(path, writer):
+    """Call ``writer(tmp_path)`` to produce the new contents of ``path``, then swap them in."""
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    handle, tmp = tempfile.mkstemp(dir=directory, prefix=f".{os.path.basename(path)}.", suffix=TMP_SUFFIX)
+    os.close(handle)
+    try:
+        writer(tmp)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def write_bytes(path, data):
+    def writer(tmp):
+        with open(tmp, "wb") as handle:
+            handle.write(data)
+
+    write(path, writer)
@@ -0,0 +1,79 @@
+"""Cold-start benchmark for the lazy page registry.
+
+For every sidebar entry, a fresh interpreter imports Streamlit plus that page's
+module and reports how long the imports took, next to the cost of the eager
+``yfinance``/``pandas``/``matplotlib.pyplot`` imports the old single-file app
+paid on every page. It also times compiling ``code.py``, which Streamlit does on
+each rerun.
+
+    python benchmarks/cold_start.py [--repeat 5] [--json]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import portfolio_pages  # noqa: E402
+
+EAGER_IMPORTS = ["yfinance", "pandas", "matplotlib.pyplot"]
+
+_PROBE = """
+import importlib, sys, time
+start = time.perf_counter()
+import streamlit
+for name in sys.argv[1:]:
+    importlib.import_module(name)
+print(time.perf_counter() - start)
+"""
+
+
+def _import_seconds(modules, repeat):
+    samples = []
+    for _ in range(repeat):
+        out = subprocess.run([sys.executable, "-c", _PROBE, *modules], cwd=ROOT, check=True,
+                             capture_output=True, text=True).stdout
+        samples.append(float(out.strip().splitlines()[-1]))
+    return statistics.median(samples)
+
+
+def _compile_seconds(path, repeat):
+    with open(path, encoding="utf-8") as handle:
+        source = handle.read()
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        compile(source, path, "exec")
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--json", action="store_true", help="print machine-readable results")
+    args = parser.parse_args()
+
+    results = {
+        "eager_imports_s": _import_seconds(EAGER_IMPORTS, args.repeat),
+        "code_py_compile_s": _compile_seconds(os.path.join(ROOT, "code.py"), args.repeat * 20),
+        "pages": {label: _import_seconds([module], args.repeat) for label, module in portfolio_pages.PAGES.items()},
+    }
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    print(f"{'eager imports (old code.py)':<32}{results['eager_imports_s'] * 1000:>10.1f} ms")
+    print(f"{'code.py compile per rerun':<32}{results['code_py_compile_s'] * 1000:>10.3f} ms")
+    for label, seconds in results["pages"].items():
+        print(f"{'first load: ' + label:<32}{seconds * 1000:>10.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
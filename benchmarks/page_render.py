@@ -0,0 +1,213 @@
+"""Headless per-page render benchmark with stubbed market data.
+
+Drives ``code.py`` through Streamlit's ``AppTest`` and visits every sidebar entry,
+each in a fresh interpreter so peak RSS is per page. ``yfinance.Ticker`` is
+replaced with a deterministic local fixture, so the suite runs offline.
+
+For each page it records the wall time of the first visit and of a warm rerun,
+plus peak RSS, matplotlib figures created, bytes read from disk and upstream
+calls. Results are compared against ``benchmarks/baseline.json``; the run exits
+non-zero when a page regresses beyond the threshold, raises, or has no baseline.
+
+    python benchmarks/page_render.py                    # compare with the baseline
+    python benchmarks/page_render.py --update-baseline  # record a new baseline
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import zlib
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BASELINE = os.path.join(ROOT, "benchmarks", "baseline.json")
+FIXTURE_END = "2025-06-30"
+
+# Relative slack per metric, and absolute slack so sub-millisecond noise never fails a run.
+TOLERANCES = {
+    "first_render_s": (0.25, 0.05),
+    "rerun_s": (0.25, 0.02),
+    "peak_rss_kb": (0.15, 8 * 1024),
+    "bytes_read": (0.10, 64 * 1024),
+    "figures": (0.0, 0),
+    "upstream_calls": (0.0, 0),
+    "exceptions": (0.0, 0),
+}
+
+
+def fixture_history(symbol, start):
+    """Deterministic daily bars for ``symbol`` from ``start`` to ``FIXTURE_END``."""
+    import numpy as np
+    import pandas as pd
+
+    index = pd.bdate_range(start, FIXTURE_END, tz="America/New_York", name="Date")
+    rng = np.random.default_rng(zlib.crc32(symbol.encode()))
+    close = 100 * np.exp(np.cumsum(rng.normal(0.0003, 0.015, len(index))))
+    open_ = close * (1 + rng.normal(0, 0.003, len(index)))
+    return pd.DataFrame({
+        "Open": open_,
+        "High": np.maximum(open_, close) * 1.005,
+        "Low": np.minimum(open_, close) * 0.995,
+        "Close": close,
+        "Volume": rng.integers(1_000_000, 5_000_000, len(index)),
+        "Dividends": 0.0,
+        "Stock Splits": 0.0,
+    }, index=index)
+
+
+def _bytes_read():
+    try:
+        with open("/proc/self/io") as handle:
+            for line in handle:
+                if line.startswith("rchar:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return 0
+
+
+def _install_stubs(counters):
+    import matplotlib.figure
+    import yfinance as yf
+
+    class FixtureTicker:
+        def __init__(self, symbol, session=None):
+            self.symbol = symbol
+
+        def history(self, start=None, **kwargs):
+            counters["upstream_calls"] += 1
+            return fixture_history(self.symbol, start or "2024-01-01")
+
+        @property
+        def info(self):
+            counters["upstream_calls"] += 1
+            return {"totalRevenue": 5e10, "sharesOutstanding": 1.5e9, "totalDebt": 1e10, "totalCash": 8e9,
+                    "currency": "USD", "financialCurrency": "USD"}
+
+    yf.Ticker = FixtureTicker
+
+    original_init = matplotlib.figure.Figure.__init__
+
+    def counting_init(self, *args, **kwargs):
+        counters["figures"] += 1
+        original_init(self, *args, **kwargs)
+
+    matplotlib.figure.Figure.__init__ = counting_init
+
+
+def run_worker(page):
+    """Render ``page`` in this process and return its metrics."""
+    import resource
+
+    from streamlit.testing.v1 import AppTest
+
+    counters = {"upstream_calls": 0, "figures": 0}
+    _install_stubs(counters)
+    os.chdir(ROOT)
+
+    app = AppTest.from_file(os.path.join(ROOT, "code.py"), default_timeout=60)
+    app.run()
+    baseline_counters = dict(counters)
+    read_before = _bytes_read()
+
+    start = time.perf_counter()
+    app.sidebar.radio[0].set_value(page).run()
+    first_render = time.perf_counter() - start
+
+    start = time.perf_counter()
+    app.run()
+    rerun = time.perf_counter() - start
+
+    return {
+        "first_render_s": first_render,
+        "rerun_s": rerun,
+        "peak_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        "bytes_read": _bytes_read() - read_before,
+        "figures": counters["figures"] - baseline_counters["figures"],
+        "upstream_calls": counters["upstream_calls"] - baseline_counters["upstream_calls"],
+        "exceptions": len(app.exception),
+    }
+
+
+def run_page(page, runs=1):
+    """Median of each metric over ``runs`` fresh workers, so one noisy run doesn't decide the result."""
+    if runs > 1:
+        samples = [run_page(page) for _ in range(runs)]
+        return {metric: statistics.median(sample[metric] for sample in samples) for metric in samples[0]}
+    with tempfile.TemporaryDirectory() as scratch:
+        env = dict(os.environ, PORTFOLIO_WARMUP="0",
+                   PORTFOLIO_PRICE_STORE=os.path.join(scratch, "prices"),
+                   PORTFOLIO_ASSET_DIR=os.path.join(scratch, "assets"))
+        out = subprocess.run([sys.executable, __file__, "--worker", page], cwd=ROOT, env=env,
+                             check=True, capture_output=True, text=True).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def regressions(results, baseline):
+    found = []
+    for page, metrics in results.items():
+        reference = baseline.get(page)
+        if reference is None:
+            found.append(f"{page}: not in the baseline")
+            continue
+        for metric, (relative, absolute) in TOLERANCES.items():
+            limit = reference[metric] * (1 + relative) + absolute
+            if metrics[metric] > limit:
+                found.append(f"{page}: {metric} {metrics[metric]:.4g} > {limit:.4g} (baseline {reference[metric]:.4g})")
+    return found
+
+
+def main():
+    sys.path.insert(0, ROOT)
+    import portfolio_pages
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--worker", metavar="PAGE", help=argparse.SUPPRESS)
+    parser.add_argument("--page", action="append", choices=list(portfolio_pages.PAGES),
+                        help="benchmark only this page (repeatable)")
+    parser.add_argument("--runs", type=int, default=3, help="workers per page; metrics are their median")
+    parser.add_argument("--baseline", default=BASELINE)
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--output", help="also write results to this JSON file")
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(run_worker(args.worker)))
+        return 0
+
+    results = {page: run_page(page, args.runs) for page in (args.page or portfolio_pages.PAGES)}
+    for page, metrics in results.items():
+        print(f"{page:<20} first {metrics['first_render_s'] * 1000:8.1f} ms  rerun {metrics['rerun_s'] * 1000:8.1f} ms  "
+              f"rss {metrics['peak_rss_kb'] / 1024:7.1f} MB  read {metrics['bytes_read'] / 1024:9.1f} KB  "
+              f"figs {metrics['figures']:3.0f}  upstream {metrics['upstream_calls']:3.0f}")
+    if args.output:
+        with open(args.output, "w") as handle:
+            json.dump(results, handle, indent=2)
+
+    if args.update_baseline:
+        baseline = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline) as handle:
+                baseline = json.load(handle)
+        baseline.update(results)
+        with open(args.baseline, "w") as handle:
+            json.dump(baseline, handle, indent=2, sort_keys=True)
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; run with --update-baseline to record one.")
+        return 1
+    with open(args.baseline) as handle:
+        found = regressions(results, json.load(handle))
+    for line in found:
+        print(f"REGRESSION {line}")
+    return 1 if found else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,36 @@
+"""In-process LRU caches bounded by the total size of their values in bytes.
+
+Shared by the chart, image variant and PDF page caches. Values are ``bytes``;
+a value larger than the whole budget is still kept until the next one arrives,
+so the entry being served is never evicted by its own insertion.
+"""
+
+import threading
+from collections import OrderedDict
+
+
+class ByteCache:
+    def __init__(self, budget):
+        self.budget = budget
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._bytes = 0
+
+    def get(self, key):
+        """The value for ``key``, marked most recently used, or None."""
+        with self._lock:
+            data = self._entries.get(key)
+            if data is not None:
+                self._entries.move_to_end(key)
+            return data
+
+    def put(self, key, data):
+        """Keep ``data`` under ``key`` and evict the least recently used entries over budget."""
+        with self._lock:
+            if key in self._entries:
+                return
+            self._entries[key] = data
+            self._bytes += len(data)
+            while self._bytes > self.budget and len(self._entries) > 1:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= len(evicted)
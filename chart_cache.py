@@ -0,0 +1,61 @@
+"""Content-hashed PNG cache for the stock charts.
+
+Charts are keyed by ticker, date range and a hash of the close series, kept in
+an LRU bounded by total bytes, and rendered on a miss with a ``Figure`` owned by
+the caller (never the pyplot registry) so nothing outlives the render.
+"""
+
+import hashlib
+import io
+import os
+
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from matplotlib.ticker import MaxNLocator
+
+import perf
+from byte_cache import ByteCache
+
+BYTE_BUDGET = int(os.environ.get("PORTFOLIO_CHART_CACHE_BYTES", 32 * 1024 * 1024))
+DPI = 200
+
+_cache = ByteCache(BYTE_BUDGET)
+
+
+def chart_key(ticker_symbol, start_date, hist):
+    closes = np.ascontiguousarray(hist["Close"].to_numpy(dtype="float64"))
+    digest = hashlib.blake2b(closes.tobytes(), digest_size=16).hexdigest()
+    end_date = hist.index[-1].strftime("%Y-%m-%d")
+    return (ticker_symbol, start_date, end_date, digest)
+
+
+def _render(ticker_symbol, start_date, hist):
+    fig = Figure(figsize=(4, 2))
+    FigureCanvasAgg(fig)
+    ax = fig.subplots()
+    ax.plot(hist.index, hist["Close"], linewidth=1.5)
+    ax.set_title(f"{ticker_symbol} – Since {start_date}", fontsize=10)
+    ax.tick_params(labelsize=8)
+    ax.grid(True, linestyle='--', alpha=0.3)
+    ax.xaxis.set_major_locator(MaxNLocator(5))
+    fig.autofmt_xdate()
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format="png", dpi=DPI, bbox_inches="tight")
+    fig.clear()
+    return buffer.getvalue()
+
+
+def close_chart_png(ticker_symbol, start_date, hist):
+    """Return PNG bytes of the close-price chart, rendering it only on a cache miss."""
+    key = chart_key(ticker_symbol, start_date, hist)
+    png = _cache.get(key)
+    if png is not None:
+        perf.count("chart_cache.hit")
+        return png
+    perf.count("chart_cache.miss")
+    # Render outside the lock; a concurrent miss on the same key just renders twice.
+    with perf.span("chart.rasterize"):
+        png = _render(ticker_symbol, start_date, hist)
+    _cache.put(key, png)
+    return png
@@ -0,0 +1,97 @@
+"""Browser-rendered stock charts.
+
+Instead of rasterising a PNG on the server, the close series is downsampled
+with Largest-Triangle-Three-Buckets to at most ``MAX_POINTS`` points, packed
+into a two-column frame (millisecond timestamps and float32 closes) that
+Streamlit ships to the browser as Arrow, and drawn by Vega-Lite with zoom and
+hover. Server work and payload size stay bounded however long the history is.
+"""
+
+import os
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+import chart_cache
+import perf
+
+MAX_POINTS = int(os.environ.get("PORTFOLIO_CHART_POINTS", 500))
+CACHE_ENTRIES = 256
+
+_lock = threading.Lock()
+_frames = OrderedDict()
+
+
+def lttb(x, y, threshold):
+    """Indices of the ``threshold`` points that best keep the visual shape of ``(x, y)``.
+
+    Bucket averages come from one cumulative-sum pass; only the choice of a
+    point per bucket, which depends on the previous choice, loops in Python.
+    """
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+
+    edges = np.floor(np.linspace(1, n - 1, threshold - 1)).astype(np.int64)
+    starts, ends = edges[:-1], edges[1:]
+    sums_x = np.concatenate([[0.0], np.cumsum(x)])
+    sums_y = np.concatenate([[0.0], np.cumsum(y)])
+    sizes = ends - starts
+    mean_x = np.append((sums_x[ends] - sums_x[starts]) / sizes, x[-1])
+    mean_y = np.append((sums_y[ends] - sums_y[starts]) / sizes, y[-1])
+
+    selected = np.empty(threshold, dtype=np.int64)
+    selected[0], selected[-1] = 0, n - 1
+    anchor = 0
+    for bucket, (start, end) in enumerate(zip(starts, ends)):
+        # Mean of the next bucket (or the last point) is the third triangle vertex.
+        next_x, next_y = mean_x[bucket + 1], mean_y[bucket + 1]
+        area = np.abs((x[anchor] - next_x) * (y[start:end] - y[anchor])
+                      - (x[anchor] - x[start:end]) * (next_y - y[anchor]))
+        anchor = start + int(np.argmax(area))
+        selected[bucket + 1] = anchor
+    return selected
+
+
+def chart_frame(ticker_symbol, start_date, hist, max_points=MAX_POINTS):
+    """Downsampled ``Date``/``Close`` frame for ``hist``, cached by content hash."""
+    key = chart_cache.chart_key(ticker_symbol, start_date, hist) + (max_points,)
+    with _lock:
+        frame = _frames.get(key)
+        if frame is not None:
+            _frames.move_to_end(key)
+            perf.count("client_chart.hit")
+            return frame
+    perf.count("client_chart.miss")
+
+    with perf.span("chart.downsample"):
+        timestamps = hist.index.tz_localize(None).to_numpy(dtype="datetime64[ms]")
+        closes = hist["Close"].to_numpy(dtype="float64")
+        keep = lttb(timestamps.astype(np.int64).astype("float64"), closes, max_points)
+        frame = pd.DataFrame({"Date": timestamps[keep], "Close": closes[keep].astype("float32")})
+
+    with _lock:
+        _frames[key] = frame
+        while len(_frames) > CACHE_ENTRIES:
+            _frames.popitem(last=False)
+    return frame
+
+
+def spec(title):
+    """Vega-Lite line chart with hover tooltips and drag/scroll zoom on the x axis."""
+    return {
+        "title": {"text": title, "fontSize": 12},
+        "height": 220,
+        "mark": {"type": "line", "strokeWidth": 1.5},
+        "params": [{"name": "zoom", "select": {"type": "interval", "encodings": ["x"]}, "bind": "scales"}],
+        "encoding": {
+            "x": {"field": "Date", "type": "temporal", "title": None},
+            "y": {"field": "Close", "type": "quantitative", "title": None, "scale": {"zero": False}},
+            "tooltip": [
+                {"field": "Date", "type": "temporal", "format": "%Y-%m-%d"},
+                {"field": "Close", "type": "quantitative", "format": "$.2f"},
+            ],
+        },
+    }
@@ -0,0 +1,132 @@
+"""Compiled content manifest for the text-and-image page sections.
+
+``content/sections.yaml`` is parsed, validated and compiled once per process
+(and again only when the file changes) into a render plan of ready-to-emit
+markdown and resolved asset paths. Missing images or unknown downloads raise
+``ContentError`` when the plan is built, before anything is drawn, and
+``python content.py`` runs the same check from the command line.
+"""
+
+import os
+import sys
+import textwrap
+import threading
+from dataclasses import dataclass
+
+import streamlit as st
+import yaml
+
+import assets
+import downloads
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+MANIFEST = os.path.join(ROOT, "content", "sections.yaml")
+ENTRY_KEYS = {"title", "body", "image", "caption", "download"}
+
+_lock = threading.Lock()
+_plans = {}
+
+
+class ContentError(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class Entry:
+    heading: str
+    body: str = None
+    image: str = None
+    caption: str = None
+    download: str = None
+
+
+@dataclass(frozen=True)
+class Section:
+    title: str
+    entries: tuple
+
+
+def _compile_entry(where, raw, problems):
+    unknown = set(raw) - ENTRY_KEYS
+    if unknown:
+        problems.append(f"{where}: unknown keys {sorted(unknown)}")
+    if not raw.get("title"):
+        problems.append(f"{where}: missing title")
+
+    image = raw.get("image")
+    if image is not None:
+        image = os.path.join(ROOT, image)
+        if not os.path.isfile(image):
+            problems.append(f"{where}.image: {raw['image']!r} does not exist")
+    download = raw.get("download")
+    if download is not None:
+        if download not in downloads.DOWNLOADS:
+            problems.append(f"{where}.download: unknown download {download!r}")
+        elif not os.path.isfile(os.path.join(ROOT, downloads.DOWNLOADS[download].path)):
+            problems.append(f"{where}.download: {downloads.DOWNLOADS[download].path!r} does not exist")
+
+    body = raw.get("body")
+    return Entry(
+        heading=f"### {raw.get('title', '')}",
+        body=textwrap.dedent(body).strip() if body else None,
+        image=image,
+        caption=raw.get("caption"),
+        download=download,
+    )
+
+
+def compile_manifest(path=MANIFEST):
+    """Parse and validate ``path`` into ``{section name: Section}``; raises ``ContentError``."""
+    with open(path, encoding="utf-8") as handle:
+        raw = yaml.safe_load(handle)
+    if not isinstance(raw, dict):
+        raise ContentError(f"{path}: expected a mapping of sections")
+
+    problems = []
+    plan = {}
+    for name, section in raw.items():
+        if not isinstance(section, dict) or not isinstance(section.get("entries"), list):
+            problems.append(f"{name}: expected a title and a list of entries")
+            continue
+        entries = tuple(_compile_entry(f"{name}.entries[{index}]", entry, problems)
+                        for index, entry in enumerate(section["entries"]))
+        plan[name] = Section(f"## {section.get('title', '')}", entries)
+    if problems:
+        raise ContentError(f"{os.path.basename(path)} is invalid:\n" + "\n".join(problems))
+    return plan
+
+
+def load_plan(path=MANIFEST):
+    """Return the compiled plan, rebuilding it only when the manifest changes."""
+    key = (path, os.stat(path).st_mtime_ns)
+    with _lock:
+        plan = _plans.get(key)
+        if plan is None:
+            _plans.clear()
+            plan = _plans[key] = compile_manifest(path)
+    return plan
+
+
+def render_section(name):
+    section = load_plan()[name]
+    st.markdown(section.title)
+    for entry in section.entries:
+        st.markdown(entry.heading)
+        if entry.body or entry.image:
+            col1, col2 = st.columns([2, 1])
+            if entry.body:
+                with col1:
+                    st.markdown(entry.body)
+            if entry.image:
+                with col2:
+                    st.image(assets.image(entry.image, 1 / 3), caption=entry.caption, use_container_width=True)
+        if entry.download:
+            downloads.button(entry.download)
+
+
+if __name__ == "__main__":
+    try:
+        sections = compile_manifest(sys.argv[1] if len(sys.argv) > 1 else MANIFEST)
+    except ContentError as error:
+        sys.exit(str(error))
+    print(f"OK: {sum(len(section.entries) for section in sections.values())} entries in {len(sections)} sections")
@@ -0,0 +1,79 @@
+"""Download manifest for the reports and decks linked from the pages.
+
+Every downloadable artifact is declared once in ``DOWNLOADS``. Its bytes are
+read the first time a page shows the button and then shared by every session
+in the process, keyed by the file's mtime and size, so reruns do no file I/O.
+Streamlit's media store deduplicates identical payloads by content hash, so
+memory does not grow with the number of sessions either.
+"""
+
+import hashlib
+import os
+import threading
+from dataclasses import dataclass
+
+import streamlit as st
+
+import pdf_preview
+import perf
+
+PDF = "application/pdf"
+PPTX = "application/vnd.openxmlformats-officedocument.presentationml.presentation"
+PNG = "image/png"
+
+
+@dataclass(frozen=True)
+class Download:
+    path: str
+    label: str
+    file_name: str
+    mime: str
+
+
+DOWNLOADS = {
+    "resume": Download("Taher Hijjaz resume copy.pdf", "📄 Download My Resume", "Taher_Hijjaz_Resume.pdf", PDF),
+    "cover_letter": Download("CV.pdf", "📄 Download My Cover Letter", "CV.pdf", PDF),
+    "nike_teaser": Download("Taher_Hijjaz_DM_Teaser.pdf", "📄 Download Nike Teaser", "Nike_Teaser.pdf", PDF),
+    "costco_report": Download("COSTCO_Equity_Report_.pdf", "📄 Download Costco Report", "Costco_Report.pdf", PDF),
+    "tsm_report": Download("TSM_Stock_Report_Taher_Hijjaz_copy.pdf", "📄 Download TSM Report", "TSM_Report.pdf", PDF),
+    "mgmt225_report": Download("MGMT_225_Final_Report_copy.pdf", "📄 Download MGMT 225 Report", "MGMT225_Final.pdf", PDF),
+    "palestine_analysis": Download("Palestine_Iraq copy.png", "📄 Download Palestine Analysis", "Palestine_Iraq copy.png", PNG),
+    "pep_house": Download("Project Pep House Deliverable.pptx", "📄 Download Analysis", "Project Pep House Deliverable.pptx", PPTX),
+}
+
+_lock = threading.Lock()
+_artifacts = {}
+
+
+@dataclass(frozen=True)
+class Artifact:
+    data: bytes
+    sha256: str
+    mtime_ns: int
+
+
+def artifact(path):
+    """Return the cached bytes of ``path``, rereading only when the file changed."""
+    stat = os.stat(path)
+    with _lock:
+        cached = _artifacts.get(path)
+    if cached is not None and cached.mtime_ns == stat.st_mtime_ns and len(cached.data) == stat.st_size:
+        perf.count("downloads.hit")
+        return cached
+    perf.count("downloads.miss")
+    with perf.span("download.read"), open(path, "rb") as handle:
+        data = handle.read()
+    cached = Artifact(data, hashlib.sha256(data).hexdigest(), stat.st_mtime_ns)
+    with _lock:
+        _artifacts[path] = cached
+    return cached
+
+
+def button(key):
+    """Render the download button declared under ``key`` in ``DOWNLOADS``, with a preview for PDFs."""
+    download = DOWNLOADS[key]
+    cached = artifact(download.path)
+    st.download_button(download.label, data=cached.data, file_name=download.file_name,
+                       mime=download.mime, key=f"download-{key}")
+    if download.mime == PDF:
+        pdf_preview.preview(key, cached)
@@ -0,0 +1,196 @@
+"""Event study of the research calls against a benchmark.
+
+Calls are read from ``content/research_calls.csv`` (``ticker, date,
+direction`` with direction ``long`` or ``short``). Each call's event day is the
+first trading day on or after its date, and returns are measured from that
+close. Abnormal return is the stock's return minus the benchmark's over the
+same days, signed by the call's direction.
+
+Every call and window is evaluated at once: event days come from one
+``searchsorted`` over the panel's dates and prices from fancy indexing into
+the close matrix, so the cost grows with array sizes rather than a Python loop
+over calls. The close panel and results are cached per calls file and store
+sync, which keeps the page interactive as the call log grows.
+"""
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+import market_data
+import perf
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+CALLS = os.path.join(ROOT, "content", "research_calls.csv")
+DIRECTIONS = {"long": 1.0, "short": -1.0}
+# Trading days after the event day; None runs to the latest close.
+WINDOWS = {"+1d": 1, "+5d": 5, "+20d": 20, "To date": None}
+CURVE_DAYS = 60
+CACHE_ENTRIES = 16
+
+_lock = threading.Lock()
+_calls = {}
+_panels = OrderedDict()
+_results = OrderedDict()
+
+
+class CallsError(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class EventStudy:
+    calls: pd.DataFrame
+    abnormal: pd.DataFrame
+    summary: pd.DataFrame
+    car: pd.DataFrame
+
+
+def load_calls(path=CALLS):
+    """The call log as a frame sorted by date, reloaded only when the file changes.
+
+    Raises ``CallsError`` when the file is missing or malformed, including rows
+    without a ticker or date. A log with no rows is valid.
+    """
+    try:
+        key = (path, os.stat(path).st_mtime_ns)
+    except OSError as error:
+        raise CallsError(f"{path}: {error.strerror}") from error
+    with _lock:
+        calls = _calls.get(key)
+    if calls is not None:
+        return calls
+
+    try:
+        calls = pd.read_csv(path, dtype={"ticker": "string", "direction": "string"}, skipinitialspace=True)
+    except ValueError as error:  # includes empty and unparsable files
+        raise CallsError(f"{path}: {error}") from error
+    missing = {"ticker", "date", "direction"} - set(calls)
+    if missing:
+        raise CallsError(f"{path}: missing columns {sorted(missing)}")
+    calls["ticker"] = calls["ticker"].str.strip().str.upper().replace("", pd.NA)
+    if calls["ticker"].isna().any():
+        raise CallsError(f"{path}: {calls['ticker'].isna().sum()} row(s) without a ticker")
+    calls["direction"] = calls["direction"].str.strip().str.lower()
+    unknown = ~calls["direction"].isin(DIRECTIONS)
+    if unknown.any():
+        raise CallsError(f"{path}: unknown direction {calls['direction'][unknown].iloc[0]!r} "
+                         f"(use {' or '.join(DIRECTIONS)})")
+    try:
+        calls["date"] = pd.to_datetime(calls["date"], errors="raise").dt.normalize()
+    except ValueError as error:
+        raise CallsError(f"{path}: bad date ({error})") from error
+    if calls["date"].isna().any():
+        raise CallsError(f"{path}: {calls['date'].isna().sum()} row(s) without a date")
+    calls = calls.sort_values("date", kind="stable", ignore_index=True)
+    with _lock:
+        _calls.clear()
+        _calls[key] = calls
+    return calls
+
+
+def requests(calls, benchmark):
+    """``(symbol, start_date)`` pairs covering every call plus the benchmark; empty without calls."""
+    if calls.empty:
+        return []
+    earliest = calls.groupby("ticker")["date"].min().dt.strftime("%Y-%m-%d")
+    return list(earliest.items()) + [(benchmark, earliest.min())]
+
+
+def _remember(cache, key, value):
+    with _lock:
+        cache[key] = value
+        while len(cache) > CACHE_ENTRIES:
+            cache.popitem(last=False)
+    return value
+
+
+def price_panel(symbols, start_date):
+    """``market_data.close_panel``, reread only when one of the symbols has been synced since."""
+    store = market_data.get_store()
+    key = (tuple(symbols), start_date, tuple((store.meta(symbol) or {}).get("synced_at") for symbol in symbols))
+    with _lock:
+        panel = _panels.get(key)
+    if panel is not None:
+        perf.count("event_study.panel_hit")
+        return panel
+    perf.count("event_study.panel_miss")
+    with perf.span("event_study.panel"):
+        return _remember(_panels, key, market_data.close_panel(symbols, start_date).sort_index().ffill())
+
+
+def compute(calls, closes, benchmark, windows=WINDOWS, curve_days=CURVE_DAYS):
+    """Signed abnormal returns of every call over every window, hit rates and mean CAR curves.
+
+    Calls whose ticker has no prices, or that fall after the last close, are
+    dropped; windows that haven't finished yet, or have no days in them yet
+    (a call made on the last close), are NaN.
+    """
+    calls = calls[calls["ticker"].isin(closes.columns) & (calls["date"] <= closes.index[-1])]
+    calls = calls.reset_index(drop=True)
+    prices = closes.to_numpy(dtype="float64")
+    bench = closes[benchmark].to_numpy(dtype="float64")
+    last = len(closes) - 1
+
+    event_day = closes.index.searchsorted(calls["date"].to_numpy(), side="left")
+    column = closes.columns.get_indexer(calls["ticker"])
+    sign = calls["direction"].map(DIRECTIONS).to_numpy(dtype="float64")
+
+    def abnormal(days):
+        # days: (calls, n) trading-day indices; NaN where a window runs past the last close.
+        inside = days <= last
+        days = np.minimum(days, last)
+        stock = prices[days, column[:, None]] / prices[event_day, column][:, None] - 1
+        market = bench[days] / bench[event_day][:, None] - 1
+        return np.where(inside, (stock - market) * sign[:, None], np.nan)
+
+    horizons = np.array([last - event_day if h is None else np.full(len(calls), h) for h in windows.values()]).T
+    returns = abnormal(event_day[:, None] + horizons)
+    by_window = pd.DataFrame(np.where(horizons > 0, returns, np.nan), columns=list(windows))
+
+    valid = by_window.notna()
+    summary = pd.DataFrame({
+        "Calls": valid.sum(),
+        "Hit rate": (by_window > 0).sum() / valid.sum().replace(0, np.nan),
+        "Mean abnormal return": by_window.mean(),
+        "Median abnormal return": by_window.median(),
+    })
+
+    offsets = np.arange(curve_days + 1)
+    curves = abnormal(event_day[:, None] + offsets)
+    counts = (~np.isnan(curves)).sum(axis=0)
+    # Days no call has reached yet are dropped rather than averaged over nothing.
+    reached = counts > 0
+    car = pd.DataFrame({"Mean CAR": np.nansum(curves[:, reached], axis=0) / counts[reached],
+                        "Calls": counts[reached]}, index=pd.Index(offsets[reached], name="Day"))
+
+    abnormal_returns = pd.concat([calls, pd.Series(closes.index[np.minimum(event_day, last)], name="event_day"),
+                                  by_window], axis=1)
+    return EventStudy(calls, abnormal_returns, summary, car)
+
+
+def study(benchmark, path=CALLS, windows=WINDOWS):
+    """``compute`` over the call log and the cached panel, memoised on both; None without calls or prices."""
+    calls = load_calls(path)
+    if calls.empty:
+        return None
+    symbols = sorted(set(calls["ticker"]) | {benchmark})
+    closes = price_panel(symbols, calls["date"].min().strftime("%Y-%m-%d"))
+    if benchmark not in closes or closes.empty:
+        return None
+
+    digest = hashlib.blake2b(np.ascontiguousarray(closes.to_numpy(dtype="float64")).tobytes(), digest_size=16)
+    key = (path, os.stat(path).st_mtime_ns, digest.hexdigest(), benchmark, tuple(windows.items()))
+    with _lock:
+        result = _results.get(key)
+    if result is not None:
+        perf.count("event_study.hit")
+        return result
+    perf.count("event_study.miss")
+    with perf.span("event_study.compute"):
+        return _remember(_results, key, compute(calls, closes, benchmark, windows))
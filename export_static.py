@@ -0,0 +1,447 @@
+"""Static HTML snapshot of every page, for serving from a CDN or file server.
+
+Each page module's ``render()`` runs against ``HtmlRecorder``, a stand-in for
+the handful of ``st`` calls the pages use, and is written to ``<out>/<page>.html``.
+Images, downloads and the stylesheet are written once under content-hashed
+names, so they can be cached forever. Stock charts and metrics come from the
+local price store, synced right before the export (unless ``--offline``), and
+are stamped with the time the prices were synced rather than the export time.
+
+A page is only re-rendered when one of its inputs changed: the Python sources,
+the media files, the content manifest (Experiences, Career Development) or the
+stored prices themselves (Projects). ``--force`` rebuilds everything.
+
+    python export_static.py [--out site] [--offline] [--force]
+"""
+
+import argparse
+import hashlib
+import html
+import json
+import os
+import sys
+import textwrap
+import time
+from contextlib import contextmanager
+
+import markdown
+import pandas as pd
+
+import portfolio_pages
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+MANIFEST_NAME = ".export-manifest.json"
+MEDIA_EXTENSIONS = (".png", ".jpg", ".jpeg", ".pdf", ".pptx")
+# Modules whose ``st`` is swapped for the recorder while a page renders.
+RENDER_MODULES = ["content", "downloads", "pdf_preview"]
+PAGE_INPUTS = {
+    "Experiences": ["content"],
+    "Career Development": ["content"],
+    "Projects": ["prices"],
+}
+
+STYLESHEET = """
+body { font-family: "Source Sans Pro", sans-serif; margin: 0; color: #262730; }
+nav { background: #f3f6fb; padding: 1rem 2rem; }
+nav a { color: #000; margin-right: 1.2rem; text-decoration: none; }
+nav a.active { font-weight: 700; }
+main { max-width: 1200px; margin: 0 auto; padding: 2rem; }
+h1 { font-size: 2.8em; font-weight: 700; color: #003366; }
+h2, h3 { color: #004080; }
+.row { display: flex; gap: 1.5rem; align-items: flex-start; }
+.row > div { min-width: 0; }
+img { max-width: 100%; }
+figcaption, .caption { color: #6b6f76; font-size: 0.875rem; }
+.metric .value { font-size: 2rem; }
+.metric .delta.up { color: #09ab3b; }
+.metric .delta.down { color: #ff2b2b; }
+.alert { background: #fff8e1; padding: 0.8rem 1rem; border-radius: 0.5rem; }
+a.download { display: inline-block; border: 1px solid #ccc; border-radius: 0.5rem; padding: 0.4rem 0.8rem;
+             color: inherit; text-decoration: none; margin: 0.5rem 0; }
+table { border-collapse: collapse; } td, th { padding: 0.25rem 0.6rem; border-bottom: 1px solid #eee; }
+footer { text-align: center; padding: 2rem; color: #6b6f76; }
+"""
+
+
+def _md(text):
+    return markdown.markdown(textwrap.dedent(str(text)).strip(), extensions=["extra"])
+
+
+def _sniff(data):
+    if data[:4] == b"RIFF" and data[8:12] == b"WEBP":
+        return ".webp"
+    if data[:8] == b"\x89PNG\r\n\x1a\n":
+        return ".png"
+    if data[:2] == b"\xff\xd8":
+        return ".jpg"
+    return ".bin"
+
+
+class Bundle:
+    """Content-addressed files under the output directory."""
+
+    def __init__(self, out):
+        self.out = out
+        self.written = set()
+
+    def add(self, data, folder, stem, extension):
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()[:12]
+        name = f"{folder}/{stem}.{digest}{extension}"
+        path = os.path.join(self.out, name)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "wb") as handle:
+                handle.write(data)
+        self.written.add(name)
+        return name
+
+
+def _join(parts):
+    return "".join(part.html() if isinstance(part, _Columns) else part for part in parts)
+
+
+class _Columns:
+    def __init__(self, recorder, weights):
+        self.recorder = recorder
+        self.weights = weights
+        self.parts = [[] for _ in weights]
+
+    def html(self):
+        cells = "".join(f'<div style="flex: {weight}">{_join(parts)}</div>'
+                        for weight, parts in zip(self.weights, self.parts))
+        return f'<div class="row">{cells}</div>'
+
+
+class _Column:
+    def __init__(self, recorder, parts):
+        self.recorder = recorder
+        self.parts = parts
+
+    def __enter__(self):
+        self.recorder._stack.append(self.parts)
+        return self
+
+    def __exit__(self, *exc):
+        self.recorder._stack.pop()
+        return False
+
+
+class _Sink:
+    """Absorbs calls the static export has no use for (the sidebar, toasts, ...)."""
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: None
+
+
+class HtmlRecorder:
+    """Implements the subset of the Streamlit API the pages call, emitting HTML."""
+
+    sidebar = _Sink()
+
+    def __init__(self, bundle):
+        self.bundle = bundle
+        self.files = set()
+        self.parts = []
+        self._stack = [self.parts]
+        self.session_state = {}
+        self.query_params = {}
+
+    def _emit(self, markup):
+        self._stack[-1].append(markup)
+
+    def _add(self, data, folder, stem, extension):
+        name = self.bundle.add(data, folder, stem, extension)
+        self.files.add(name)
+        return name
+
+    def html(self):
+        return _join(self.parts)
+
+    # --- layout ---
+    def columns(self, spec, **kwargs):
+        weights = [1] * spec if isinstance(spec, int) else list(spec)
+        row = _Columns(self, weights)
+        self._emit(row)
+        return [_Column(self, parts) for parts in row.parts]
+
+    @contextmanager
+    def expander(self, label, expanded=False):
+        self._emit(f"<details{' open' if expanded else ''}><summary>{html.escape(label)}</summary>")
+        yield self
+        self._emit("</details>")
+
+    def fragment(self, func=None, **kwargs):
+        return func if func is not None else (lambda inner: inner)
+
+    # --- text ---
+    def title(self, text, **kwargs):
+        self._emit(f"<h1>{html.escape(text)}</h1>")
+
+    def markdown(self, text, unsafe_allow_html=False, **kwargs):
+        self._emit(_md(text))
+
+    def write(self, *values, **kwargs):
+        for value in values:
+            if hasattr(value, "to_html"):
+                self._emit(value.to_html())
+            else:
+                self._emit(_md(value))
+
+    def caption(self, text, **kwargs):
+        self._emit(f'<div class="caption">{_md(text)}</div>')
+
+    def code(self, text, **kwargs):
+        self._emit(f"<pre><code>{html.escape(text)}</code></pre>")
+
+    def warning(self, text, **kwargs):
+        self._emit(f'<div class="alert">{_md(text)}</div>')
+
+    info = error = success = warning
+
+    # --- data ---
+    def metric(self, label, value, delta=None, **kwargs):
+        markup = f'<div class="caption">{html.escape(str(label))}</div><div class="value">{html.escape(str(value))}</div>'
+        if delta is not None:
+            direction = "down" if str(delta).startswith("-") else "up"
+            markup += f'<div class="delta {direction}">{html.escape(str(delta))}</div>'
+        self._emit(f'<div class="metric">{markup}</div>')
+
+    def dataframe(self, data, **kwargs):
+        self._emit(data.to_html())
+
+    def table(self, data, **kwargs):
+        import pandas as pd
+        self._emit(pd.DataFrame(data).to_html(index=False))
+
+    def map(self, data, **kwargs):
+        points = ", ".join(f"{lat:.2f}, {lon:.2f}" for lat, lon in zip(data["lat"], data["lon"]))
+        self._emit(f'<div class="caption">📍 {html.escape(points)}</div>')
+
+    # --- media ---
+    def image(self, data, caption=None, **kwargs):
+        if isinstance(data, str):
+            with open(data, "rb") as handle:
+                data = handle.read()
+        src = self._add(data, "assets", "image", _sniff(data))
+        figcaption = f"<figcaption>{html.escape(caption)}</figcaption>" if caption else ""
+        self._emit(f'<figure><img src="{src}" alt="{html.escape(caption or "")}" loading="lazy">{figcaption}</figure>')
+
+    def pyplot(self, fig, **kwargs):
+        import io
+        buffer = io.BytesIO()
+        fig.savefig(buffer, format="png", dpi=200, bbox_inches="tight")
+        self.image(buffer.getvalue())
+
+    def download_button(self, label, data, file_name, mime=None, **kwargs):
+        stem, extension = os.path.splitext(file_name)
+        href = self._add(data, "files", stem.replace(" ", "_"), extension)
+        self._emit(f'<a class="download" href="{href}" download="{html.escape(file_name)}">{html.escape(label)}</a>')
+
+    # --- widgets fall back to their defaults ---
+    def toggle(self, label, value=False, **kwargs):
+        return value
+
+    checkbox = toggle
+
+    def slider(self, label, min_value=None, max_value=None, value=None, **kwargs):
+        return value if value is not None else min_value
+
+    number_input = slider
+
+    def selectbox(self, label, options, index=0, **kwargs):
+        options = list(options)
+        return options[index] if options and index is not None else None
+
+    radio = selectbox
+
+    def multiselect(self, label, options, default=None, **kwargs):
+        return list(default or [])
+
+    def file_uploader(self, *args, **kwargs):
+        return None
+
+
+@contextmanager
+def _recording(modules, recorder):
+    originals = {module: module.st for module in modules if hasattr(module, "st")}
+    for module in originals:
+        module.st = recorder
+    try:
+        yield
+    finally:
+        for module, original in originals.items():
+            module.st = original
+
+
+def slug(label):
+    return "index" if label == "Home" else label.lower().replace(" ", "-")
+
+
+def _tree_fingerprint(paths):
+    digest = hashlib.sha256()
+    for path in sorted(paths):
+        stat = os.stat(path)
+        digest.update(f"{os.path.relpath(path, ROOT)}:{stat.st_size}:{stat.st_mtime_ns}\n".encode())
+    return digest.hexdigest()
+
+
+def _prices_fingerprint(root):
+    # Bars, not files: every sync rewrites the parquet files, usually with the same prices.
+    digest = hashlib.sha256()
+    for path in sorted(_walk(root, (".parquet",))):
+        bars = pd.read_parquet(path, columns=["Open", "Close"])
+        last = bars.index[-1].isoformat() if len(bars) else ""
+        digest.update(f"{os.path.basename(path)}:{len(bars)}:{last}\n".encode())
+        digest.update(pd.util.hash_pandas_object(bars).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+def _walk(top, extensions, skip=()):
+    for directory, subdirs, files in os.walk(top):
+        subdirs[:] = [name for name in subdirs if not name.startswith(".") and name not in skip]
+        for name in files:
+            if name.endswith(extensions):
+                yield os.path.join(directory, name)
+
+
+def input_fingerprints(out):
+    """Fingerprints of everything a page's HTML depends on, by input name."""
+    import market_data
+
+    skip = {os.path.basename(os.path.abspath(out)), "benchmarks"}
+    store = market_data.get_store()
+    return {
+        "code": _tree_fingerprint(_walk(ROOT, (".py",), skip)),
+        "media": _tree_fingerprint(_walk(ROOT, MEDIA_EXTENSIONS, skip)),
+        "content": _tree_fingerprint(_walk(os.path.join(ROOT, "content"), (".yaml", ".yml"))),
+        "prices": _prices_fingerprint(store.root),
+    }
+
+
+def page_fingerprint(label, inputs):
+    names = ["code", "media"] + PAGE_INPUTS.get(label, [])
+    return hashlib.sha256("".join(inputs[name] for name in names).encode()).hexdigest()
+
+
+def _document(label, body, stylesheet, stamp):
+    nav = "".join(f'<a href="{slug(other)}.html"{" class=active" if other == label else ""}>{html.escape(other)}</a>'
+                  for other in portfolio_pages.PAGES)
+    return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{html.escape(label)} – Taher Hijjaz Portfolio</title>
+<link rel="stylesheet" href="{stylesheet}">
+</head>
+<body>
+<nav>{nav}</nav>
+<main>
+{body}
+</main>
+<footer>Made with ❤️ by Taher Hijjaz | {html.escape(stamp)}</footer>
+</body>
+</html>
+"""
+
+
+def price_requests():
+    """``(symbol, start_date)`` for every name on the Projects page."""
+    from portfolio_pages import projects
+
+    requests = [(symbol, start) for _, symbol, start in projects.COVERAGE]
+    return requests + [(projects.BENCHMARK, projects.COMPARISON_START)]
+
+
+def sync_prices():
+    """Bring the price store up to date for every name on the Projects page."""
+    import market_data
+
+    market_data.fetch_histories(price_requests())
+
+
+def prices_synced_at():
+    """When the stalest of the Projects page's prices was synced, or None if none are stored."""
+    import market_data
+
+    store = market_data.get_store()
+    synced = [meta["synced_at"] for meta in (store.meta(symbol) for symbol, _ in price_requests()) if meta]
+    return min(synced) if synced else None
+
+
+def export(out="site", force=False, offline=False):
+    """Write the static site to ``out``; returns the labels of the pages rebuilt.
+
+    Prices are synced once up front (skipped with ``offline``); pages then read
+    the store as it is and never start the background refresher.
+    """
+    import importlib
+
+    import refresher
+
+    if not offline:
+        sync_prices()
+    os.makedirs(out, exist_ok=True)
+    manifest_path = os.path.join(out, MANIFEST_NAME)
+    previous = {}
+    if os.path.exists(manifest_path) and not force:
+        with open(manifest_path) as handle:
+            previous = json.load(handle)
+
+    bundle = Bundle(out)
+    stylesheet = bundle.add(STYLESHEET, "assets", "style", ".css")
+    inputs = input_fingerprints(out)
+    generated_at = refresher.format_time(time.time())
+    synced_at = prices_synced_at()
+    # Pages showing prices are stamped with the price time, which the export time would overstate.
+    prices_stamp = f"Prices as of {refresher.format_time(synced_at)}" if synced_at else "No stored prices"
+    render_modules = [importlib.import_module(name) for name in RENDER_MODULES]
+
+    pages = {}
+    rebuilt = []
+    for label in portfolio_pages.PAGES:
+        fingerprint = page_fingerprint(label, inputs)
+        entry = previous.get("pages", {}).get(label)
+        page_file = os.path.join(out, f"{slug(label)}.html")
+        if entry and entry["fingerprint"] == fingerprint and os.path.exists(page_file):
+            pages[label] = entry
+            bundle.written.update(entry["files"])
+            continue
+
+        stamp = prices_stamp if "prices" in PAGE_INPUTS.get(label, []) else f"Snapshot of {generated_at}"
+        recorder = HtmlRecorder(bundle)
+        module = portfolio_pages.load(label)
+        with _recording(render_modules + [module], recorder), refresher.store_only():
+            module.render()
+        with open(page_file, "w", encoding="utf-8") as handle:
+            handle.write(_document(label, recorder.html(), stylesheet, stamp))
+        files = sorted(recorder.files | {stylesheet})
+        pages[label] = {"fingerprint": fingerprint, "files": files, "generated_at": generated_at}
+        rebuilt.append(label)
+
+    # Drop fingerprinted files no page refers to any more.
+    for folder in ("assets", "files"):
+        directory = os.path.join(out, folder)
+        for name in os.listdir(directory) if os.path.isdir(directory) else []:
+            if f"{folder}/{name}" not in bundle.written:
+                os.remove(os.path.join(directory, name))
+
+    with open(manifest_path, "w") as handle:
+        json.dump({"pages": pages}, handle, indent=2)
+    return rebuilt
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--out", default="site")
+    parser.add_argument("--force", action="store_true", help="rebuild every page")
+    parser.add_argument("--offline", action="store_true", help="use the price store as is, without syncing")
+    args = parser.parse_args()
+    rebuilt = export(args.out, force=args.force, offline=args.offline)
+    print(f"Rebuilt {len(rebuilt)} page(s): {', '.join(rebuilt) or 'none'}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
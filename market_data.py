@@ -0,0 +1,175 @@
+"""Market data layer for the Projects page.
+
+All tickers a page needs are collected up front and fetched together on a
+bounded thread pool that shares one pooled HTTP session, so a page waits for
+the slowest ticker instead of the sum of all of them. Bars are persisted in the
+shared ``PriceStore``; the upstream is only asked for what the store is missing
+and pages read their slices from disk.
+"""
+
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+
+import pandas as pd
+import yfinance as yf
+
+import atomic
+import perf
+from price_store import PriceStore
+
+MAX_WORKERS = 8
+REQUEST_TIMEOUT = 10  # seconds, per upstream request
+PAGE_DEADLINE = 12  # seconds, for the whole batch
+FUNDAMENTALS_MAX_AGE = 24 * 3600
+FUNDAMENTAL_FIELDS = ("totalRevenue", "sharesOutstanding", "totalDebt", "totalCash")
+
+_executor = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="market-data")
+_session = None
+_session_lock = threading.Lock()
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_session():
+    """Return the process-wide HTTP session shared by every upstream call."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            try:
+                # Recent yfinance releases require a curl_cffi session.
+                from curl_cffi import requests as curl_requests
+                _session = curl_requests.Session(impersonate="chrome")
+            except ImportError:
+                import requests
+                _session = requests.Session()
+                adapter = requests.adapters.HTTPAdapter(pool_connections=MAX_WORKERS, pool_maxsize=MAX_WORKERS)
+                _session.mount("https://", adapter)
+        return _session
+
+
+def get_store():
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = PriceStore()
+        return _store
+
+
+def download(symbol, start_date):
+    """Fetch daily bars for ``symbol`` from ``start_date`` straight from the upstream."""
+    perf.count("upstream.calls")
+    with perf.span("upstream.fetch"):
+        ticker = yf.Ticker(symbol, session=get_session())
+        return ticker.history(start=start_date, timeout=REQUEST_TIMEOUT)
+
+
+def _fetch_one(symbol, start_date):
+    store = get_store()
+    store.sync(symbol, start_date, download)
+    return store.read(symbol, start_date)
+
+
+def fetch_histories(requests, deadline=PAGE_DEADLINE):
+    """Fetch daily history for every ``(symbol, start_date)`` pair in one batch.
+
+    Each symbol is synced once from its earliest start date. Returns a dict
+    mapping ``(symbol, start_date)`` to a DataFrame; failed or late syncs fall
+    back to the last good bars already in the store.
+    """
+    requests = list(requests)
+    earliest = {}
+    for symbol, start_date in requests:
+        if symbol not in earliest or start_date < earliest[symbol]:
+            earliest[symbol] = start_date
+
+    futures = {symbol: _executor.submit(_fetch_one, symbol, start) for symbol, start in earliest.items()}
+    wait(futures.values(), timeout=deadline)
+
+    store = get_store()
+    results = {}
+    for symbol, start_date in requests:
+        future = futures[symbol]
+        if future.done() and future.exception() is None:
+            results[(symbol, start_date)] = future.result().loc[start_date:]
+        else:
+            # Late or failed sync: serve whatever the store already holds.
+            results[(symbol, start_date)] = store.read(symbol, start_date)
+    return results
+
+
+def fetch_since(symbol, since, max_age):
+    """Bars for ``symbol`` from ``since`` on, syncing the store if it is older than ``max_age`` seconds.
+
+    Used by live mode: the shared store keeps upstream traffic at one call per
+    ticker per ``max_age`` no matter how many sessions are watching.
+    """
+    store = get_store()
+    try:
+        store.sync(symbol, since, download, max_age=max_age)
+    except Exception:
+        pass  # keep serving the stored bars
+    return store.read(symbol, since)
+
+
+def _fx_rate(source, target):
+    """Latest ``source`` -> ``target`` exchange rate from Yahoo's ``XXXYYY=X`` pairs."""
+    perf.count("upstream.calls")
+    hist = yf.Ticker(f"{source}{target}=X", session=get_session()).history(period="5d", timeout=REQUEST_TIMEOUT)
+    return float(hist["Close"].iloc[-1])
+
+
+def fundamentals(symbol, max_age=FUNDAMENTALS_MAX_AGE):
+    """Revenue, share count, debt and cash for ``symbol``, cached next to its prices for a day.
+
+    Money fields are in the currency the shares trade in (``currency``).
+    Companies that report in another currency, such as ADRs, are converted at
+    the latest exchange rate, recorded as ``fx_rate``. Returns None when the
+    upstream has never provided all of them.
+    """
+    path = os.path.join(get_store().root, f"{symbol.upper()}.fundamentals.json")
+    cached = None
+    try:
+        with open(path) as handle:
+            cached = json.load(handle)
+        if "fx_rate" not in cached["fields"]:
+            cached = None  # written before reporting currencies were converted
+        elif time.time() - cached["fetched_at"] < max_age:
+            return cached["fields"]
+    except (OSError, ValueError, KeyError):
+        cached = None
+
+    try:
+        perf.count("upstream.calls")
+        info = yf.Ticker(symbol, session=get_session()).info
+        fields = {name: info.get(name) for name in FUNDAMENTAL_FIELDS}
+        currency = info.get("currency")
+        financial_currency = info.get("financialCurrency") or currency
+        fx_rate = 1.0
+        if currency and financial_currency != currency:
+            fx_rate = _fx_rate(financial_currency, currency)
+            for name in ("totalRevenue", "totalDebt", "totalCash"):
+                if fields[name] is not None:
+                    fields[name] *= fx_rate
+        fields.update(currency=currency, financial_currency=financial_currency, fx_rate=fx_rate)
+    except Exception:
+        fields = None
+    if not fields or any(fields[name] is None for name in FUNDAMENTAL_FIELDS + ("currency",)):
+        return cached["fields"] if cached else None
+
+    atomic.write_bytes(path, json.dumps({"fetched_at": time.time(), "fields": fields}).encode())
+    return fields
+
+
+def close_panel(symbols, start_date):
+    """Daily closes for ``symbols`` from ``start_date`` as one DataFrame, read from the store only."""
+    store = get_store()
+    closes = {}
+    for symbol in symbols:
+        hist = store.read(symbol, start_date)
+        if not hist.empty:
+            # Drop the exchange timezone so tickers listed in different zones align by date.
+            closes[symbol] = hist["Close"].set_axis(hist.index.tz_localize(None).normalize())
+    return pd.DataFrame(closes)
@@ -0,0 +1,164 @@
+"""Positional heatmaps, pass networks and zone summaries from match event data.
+
+Event files (CSV or Parquet with ``match_id, player, team, x, y, timestamp,
+event_type`` columns, coordinates on a 0-100 pitch) are read from
+``PORTFOLIO_MATCH_DATA`` (default ``data/matches``) once per change. Every
+aggregate is a single ``np.bincount`` over combined group/bin indices, so all
+players and teams are binned in one pass. Results are cached per
+(data version, matches, event filter), which makes switching players or teams
+a lookup.
+"""
+
+import io
+import os
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+import perf
+
+DATA_DIR = os.environ.get("PORTFOLIO_MATCH_DATA", os.path.join("data", "matches"))
+COLUMNS = ["match_id", "player", "team", "x", "y", "timestamp", "event_type"]
+PITCH_LENGTH = 100.0
+PITCH_WIDTH = 100.0
+BINS = (12, 8)
+ZONES_X = ["Defensive third", "Middle third", "Final third"]
+ZONES_Y = ["Left", "Centre", "Right"]
+PASS_EVENT = "pass"
+
+_loaded = {"version": None, "events": None}
+
+
+def _files(root):
+    if not os.path.isdir(root):
+        return []
+    return sorted(os.path.join(root, name) for name in os.listdir(root)
+                  if name.endswith((".csv", ".parquet")))
+
+
+def data_version(root=DATA_DIR):
+    """Hashable fingerprint of the event files; changes whenever one is edited."""
+    return tuple((path, os.stat(path).st_mtime_ns, os.stat(path).st_size) for path in _files(root))
+
+
+def load_events(root=DATA_DIR):
+    """All events under ``root`` as one frame with categorical keys, sorted by match and time."""
+    version = data_version(root)
+    if _loaded["version"] == version:
+        return _loaded["events"]
+    with perf.span("match_events.load"):
+        frames = [pd.read_parquet(path, columns=COLUMNS) if path.endswith(".parquet")
+                  else pd.read_csv(path, usecols=COLUMNS) for path in _files(root)]
+        events = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=COLUMNS)
+        events = events.astype({"match_id": "str", "player": "str", "team": "str", "event_type": "str"})
+        events = events.astype({"match_id": "category", "player": "category", "team": "category",
+                                "event_type": "category", "x": "float32", "y": "float32"})
+        events = events.sort_values(["match_id", "timestamp"], kind="stable", ignore_index=True)
+    _loaded.update(version=version, events=events)
+    return events
+
+
+def filter_events(events, matches=(), event_types=()):
+    mask = np.ones(len(events), dtype=bool)
+    if matches:
+        mask &= events["match_id"].isin(matches).to_numpy()
+    if event_types:
+        mask &= events["event_type"].isin(event_types).to_numpy()
+    return events[mask]
+
+
+def _bin(events, bins):
+    nx, ny = bins
+    xb = np.clip((events["x"].to_numpy() / PITCH_LENGTH * nx).astype(np.int64), 0, nx - 1)
+    yb = np.clip((events["y"].to_numpy() / PITCH_WIDTH * ny).astype(np.int64), 0, ny - 1)
+    return xb, yb
+
+
+def heatmaps(events, by, bins=BINS):
+    """Per-group occupancy grids: ``(labels, counts)`` with ``counts[group, x_bin, y_bin]``."""
+    nx, ny = bins
+    labels = list(events[by].cat.categories)
+    codes = events[by].cat.codes.to_numpy().astype(np.int64)
+    xb, yb = _bin(events, bins)
+    flat = (codes * nx + xb) * ny + yb
+    counts = np.bincount(flat, minlength=len(labels) * nx * ny).reshape(len(labels), nx, ny)
+    return labels, counts
+
+
+def zone_summary(events, by="team"):
+    """Event counts per group in a 3x3 grid of pitch thirds by channels."""
+    labels, counts = heatmaps(events, by, bins=(3, 3))
+    columns = pd.MultiIndex.from_product([ZONES_X, ZONES_Y])
+    return pd.DataFrame(counts.reshape(len(labels), 9), index=labels, columns=columns)
+
+
+def pass_network(events):
+    """Completed passes between team-mates and each player's average position.
+
+    A pass counts as completed to the next event's player when that event is
+    in the same match and by the same team.
+    """
+    players = events["player"].cat.categories
+    player = events["player"].cat.codes.to_numpy().astype(np.int64)
+    team = events["team"].cat.codes.to_numpy()
+    match = events["match_id"].cat.codes.to_numpy()
+    is_pass = (events["event_type"] == PASS_EVENT).to_numpy()
+
+    completed = is_pass[:-1] & (match[:-1] == match[1:]) & (team[:-1] == team[1:]) & (player[:-1] != player[1:])
+    pairs = player[:-1][completed] * len(players) + player[1:][completed]
+    counts = np.bincount(pairs, minlength=len(players) ** 2)
+    nonzero = np.flatnonzero(counts)
+    edges = pd.DataFrame({
+        "passer": players[nonzero // len(players)],
+        "receiver": players[nonzero % len(players)],
+        "passes": counts[nonzero],
+    }).sort_values("passes", ascending=False, ignore_index=True)
+
+    touches = np.bincount(player, minlength=len(players))
+    with np.errstate(invalid="ignore"):
+        positions = pd.DataFrame({
+            "x": np.bincount(player, weights=events["x"].to_numpy(), minlength=len(players)) / touches,
+            "y": np.bincount(player, weights=events["y"].to_numpy(), minlength=len(players)) / touches,
+            "events": touches,
+        }, index=players)
+    return edges, positions[touches > 0]
+
+
+@lru_cache(maxsize=64)
+def analysis(version, matches=(), event_types=()):
+    """Batched heatmaps for every player and team plus zone and pass summaries, cached per filter."""
+    with perf.span("match_events.analysis"):
+        in_matches = filter_events(load_events(), matches)
+        events = filter_events(in_matches, event_types=event_types)
+        return {
+            "events": len(events),
+            "players": heatmaps(events, "player"),
+            "teams": heatmaps(events, "team"),
+            "zones": zone_summary(events),
+            # Completion depends on the next event of any type, so ignore the type filter here.
+            "passes": pass_network(in_matches),
+        }
+
+
+@lru_cache(maxsize=256)
+def heatmap_png(version, matches, event_types, by, label):
+    """PNG of one player's or team's heatmap, rendered on an owned Figure."""
+    labels, counts = analysis(version, matches, event_types)["players" if by == "player" else "teams"]
+    grid = counts[labels.index(label)]
+
+    fig = Figure(figsize=(5, 3.4))
+    FigureCanvasAgg(fig)
+    ax = fig.subplots()
+    ax.imshow(grid.T, origin="lower", extent=(0, PITCH_LENGTH, 0, PITCH_WIDTH), cmap="YlOrRd",
+              aspect="auto", interpolation="bicubic")
+    ax.axvline(PITCH_LENGTH / 2, color="white", linewidth=1)
+    ax.set_title(f"{label} – {int(grid.sum())} events", fontsize=10)
+    ax.set_xticks([])
+    ax.set_yticks([])
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format="png", dpi=150, bbox_inches="tight")
+    fig.clear()
+    return buffer.getvalue()
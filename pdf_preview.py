@@ -0,0 +1,165 @@
+"""Inline previews for the PDF downloads.
+
+Nothing is rasterised until a visitor opens a preview, and then only the
+selected page (at the resolution of the column it is shown in) and the
+thumbnails in view. Rendered pages are WebP images keyed by the PDF's content
+hash, page and DPI, kept in an in-process LRU bounded by bytes and in
+``.assets/pdf/``, which is pruned oldest-first once it outgrows its budget, so
+other workers and later visitors reuse them.
+"""
+
+import io
+import os
+import threading
+
+try:
+    import pypdfium2 as pdfium
+except ImportError:  # previews are skipped, downloads still work
+    pdfium = None
+
+import streamlit as st
+
+import assets
+import atomic
+import perf
+from byte_cache import ByteCache
+
+CACHE_DIR = os.path.join(assets.BUILD_DIR, "pdf")
+CACHE_BYTES = int(os.environ.get("PORTFOLIO_PDF_CACHE_BYTES", 32 * 1024 * 1024))
+DISK_BYTES = int(os.environ.get("PORTFOLIO_PDF_DISK_BYTES", 256 * 1024 * 1024))
+# Fraction of the layout the preview column takes, and the rendered thumbnail width in pixels.
+PREVIEW_FRACTION = 1 / 2
+THUMB_WIDTH = 160
+THUMBS_PER_STRIP = 6
+WEBP_QUALITY = 80
+
+# PDFium is not thread-safe; every call into it goes through this lock.
+_pdfium_lock = threading.Lock()
+_cache = ByteCache(CACHE_BYTES)
+_page_sizes = {}
+
+
+def available():
+    return pdfium is not None
+
+
+def page_sizes(artifact):
+    """Width and height in points of every page, read once per file version."""
+    sizes = _page_sizes.get(artifact.sha256)
+    if sizes is None:
+        with _pdfium_lock:
+            document = pdfium.PdfDocument(artifact.data)
+            try:
+                sizes = [document.get_page_size(index) for index in range(len(document))]
+            finally:
+                document.close()
+        _page_sizes[artifact.sha256] = sizes
+    return sizes
+
+
+def dpi_for(width_points, width_pixels):
+    return max(1, round(72 * width_pixels / width_points))
+
+
+def _cache_path(digest, page, dpi):
+    return os.path.join(CACHE_DIR, f"{digest[:16]}.p{page}.d{dpi}.webp")
+
+
+def _rasterise(artifact, page, dpi):
+    with perf.span("pdf.rasterise"), _pdfium_lock:
+        # Loading from bytes only parses the cross-reference table; other pages stay untouched.
+        document = pdfium.PdfDocument(artifact.data)
+        try:
+            image = document[page].render(scale=dpi / 72).to_pil()
+        finally:
+            document.close()
+    buffer = io.BytesIO()
+    image.convert("RGB").save(buffer, format="WEBP", quality=WEBP_QUALITY)
+    return buffer.getvalue()
+
+
+def _prune_disk():
+    entries = []
+    for name in os.listdir(CACHE_DIR):
+        if name.endswith(atomic.TMP_SUFFIX):  # another thread's write in progress
+            continue
+        try:
+            stat = os.stat(os.path.join(CACHE_DIR, name))
+        except FileNotFoundError:  # removed by another worker
+            continue
+        entries.append((stat.st_mtime, stat.st_size, name))
+    total = sum(size for _, size, _ in entries)
+    for _, size, name in sorted(entries):
+        if total <= DISK_BYTES:
+            break
+        try:
+            os.remove(os.path.join(CACHE_DIR, name))
+        except FileNotFoundError:
+            pass
+        total -= size
+
+
+def _load(artifact, page, dpi):
+    path = _cache_path(artifact.sha256, page, dpi)
+    try:
+        with open(path, "rb") as handle:
+            data = handle.read()
+        os.utime(path)  # mtime doubles as last use for pruning
+        perf.count("pdf.disk_hit")
+        return data
+    except FileNotFoundError:
+        pass
+    perf.count("pdf.miss")
+    data = _rasterise(artifact, page, dpi)
+    atomic.write_bytes(path, data)
+    _prune_disk()
+    return data
+
+
+def page_image(artifact, page, dpi):
+    """WebP bytes of ``page`` (0-based) rendered at ``dpi``."""
+    key = (artifact.sha256, page, dpi)
+    data = _cache.get(key)
+    if data is not None:
+        perf.count("pdf.hit")
+        return data
+    data = _load(artifact, page, dpi)
+    _cache.put(key, data)
+    return data
+
+
+def _select(key, page):
+    st.session_state[f"preview-page-{key}"] = page + 1
+
+
+@st.fragment
+def _viewer(key, artifact):
+    # A fragment, so paging through a report only reruns the preview.
+    sizes = page_sizes(artifact)
+    page = 0
+    if len(sizes) > 1:
+        page = st.number_input("Page", 1, len(sizes), key=f"preview-page-{key}") - 1
+
+    # The selected page first, so it shows up before any thumbnail is rendered.
+    width, _ = sizes[page]
+    dpi = dpi_for(width, assets.variant_width(PREVIEW_FRACTION))
+    st.image(page_image(artifact, page, dpi), caption=f"Page {page + 1} of {len(sizes)}", use_container_width=True)
+    if len(sizes) < 2:
+        return
+
+    # Only the strip around the selected page is rasterised, at thumbnail size.
+    first = min(max(page - THUMBS_PER_STRIP // 2, 0), max(len(sizes) - THUMBS_PER_STRIP, 0))
+    columns = st.columns(THUMBS_PER_STRIP)
+    for column, index in zip(columns, range(first, min(first + THUMBS_PER_STRIP, len(sizes)))):
+        with column:
+            st.image(page_image(artifact, index, dpi_for(sizes[index][0], THUMB_WIDTH)), use_container_width=True)
+            st.button(str(index + 1), key=f"preview-thumb-{key}-{index}", disabled=index == page,
+                      on_click=_select, args=(key, index), use_container_width=True)
+
+
+def preview(key, artifact):
+    """Opt-in inline preview of the PDF download ``key``."""
+    if not available():
+        return
+    if st.toggle("Preview", key=f"preview-{key}"):
+        _viewer(key, artifact)
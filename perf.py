@@ -0,0 +1,148 @@
+"""Lightweight timing spans and counters for the render hot path.
+
+Instrumentation is off unless ``PORTFOLIO_PERF=1`` is set for the process or a
+visitor opens the app with ``?perf=1``. When it is off, ``span`` returns a shared
+no-op context manager and ``count`` returns immediately.
+
+Each rerun collects its own spans and counters (Streamlit runs every session's
+script on its own thread); process-wide totals feed the Prometheus export.
+Work on background threads, such as the price refresher, only reaches the totals.
+"""
+
+import contextlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import defaultdict
+
+ENABLED = os.environ.get("PORTFOLIO_PERF", "0") == "1"
+
+# Streamlit leaves the root logger at WARNING, so the per-rerun JSON lines get their own handler.
+logger = logging.getLogger("portfolio.perf")
+if not logger.handlers:
+    _handler = logging.StreamHandler()
+    _handler.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(_handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+_NULL_SPAN = contextlib.nullcontext()
+_local = threading.local()
+_totals_lock = threading.Lock()
+_span_totals = defaultdict(lambda: [0, 0.0])
+_counter_totals = defaultdict(int)
+
+
+def _record():
+    return getattr(_local, "record", None)
+
+
+def active():
+    return ENABLED or _record() is not None
+
+
+class _Span:
+    __slots__ = ("name", "record", "start")
+
+    def __init__(self, name, record):
+        self.name = name
+        self.record = record
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        elapsed = time.perf_counter() - self.start
+        if self.record is not None:
+            self.record["spans"].append((self.name, elapsed))
+        with _totals_lock:
+            totals = _span_totals[self.name]
+            totals[0] += 1
+            totals[1] += elapsed
+        return False
+
+
+def span(name):
+    """Time the enclosed block under ``name``."""
+    record = _record()
+    if record is None and not ENABLED:
+        return _NULL_SPAN
+    return _Span(name, record)
+
+
+def count(name, n=1):
+    """Add ``n`` to the counter ``name`` (cache hits/misses, upstream calls, ...)."""
+    record = _record()
+    if record is None and not ENABLED:
+        return
+    if record is not None:
+        record["counters"][name] += n
+    with _totals_lock:
+        _counter_totals[name] += n
+
+
+def begin_rerun(enabled=False):
+    """Start collecting for the current script run; ``enabled`` opts this session in."""
+    _local.record = {"spans": [], "counters": defaultdict(int), "start": time.perf_counter()} if enabled or ENABLED else None
+
+
+def rerun_report(page=None):
+    record = _record()
+    if record is None:
+        return None
+    return {
+        "page": page,
+        "total_s": time.perf_counter() - record["start"],
+        "spans": [{"name": name, "seconds": seconds} for name, seconds in record["spans"]],
+        "counters": dict(record["counters"]),
+    }
+
+
+def log_rerun(page=None):
+    report = rerun_report(page)
+    if report is not None:
+        logger.info(json.dumps(report))
+    return report
+
+
+def prometheus_text():
+    """Process-wide totals in the Prometheus text exposition format."""
+    with _totals_lock:
+        spans = sorted((name, tuple(totals)) for name, totals in _span_totals.items())
+        counters = sorted(_counter_totals.items())
+    lines = [
+        "# HELP portfolio_span_seconds Time spent in instrumented render stages.",
+        "# TYPE portfolio_span_seconds summary",
+    ]
+    for name, (calls, seconds) in spans:
+        lines.append(f'portfolio_span_seconds_count{{span="{name}"}} {calls}')
+        lines.append(f'portfolio_span_seconds_sum{{span="{name}"}} {seconds:.6f}')
+    lines += [
+        "# HELP portfolio_events_total Cache hits/misses and upstream calls.",
+        "# TYPE portfolio_events_total counter",
+    ]
+    for name, value in counters:
+        lines.append(f'portfolio_events_total{{event="{name}"}} {value}')
+    return "\n".join(lines) + "\n"
+
+
+def render_panel(page=None):
+    """Show this rerun's spans and counters in a sidebar panel and log them as JSON."""
+    report = log_rerun(page)
+    if report is None:
+        return
+    import streamlit as st
+
+    with st.sidebar.expander("⏱️ Performance", expanded=True):
+        st.caption(f"Rerun total: {report['total_s'] * 1000:.1f} ms")
+        if report["spans"]:
+            st.table({
+                "stage": [item["name"] for item in report["spans"]],
+                "ms": [round(item["seconds"] * 1000, 2) for item in report["spans"]],
+            })
+        if report["counters"]:
+            st.table({"counter": list(report["counters"]), "value": list(report["counters"].values())})
+        st.code(prometheus_text(), language="text")
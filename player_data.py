@@ -0,0 +1,340 @@
+"""Validation of bulk player/attribute imports for the Sports Interactive research.
+
+A dataset (CSV or Parquet, one row per player with ``player_id, name, club,
+position`` and one column per attribute) is streamed in chunks of
+``CHUNK_ROWS`` rows, so memory is bounded by the chunk size plus a few compact
+key columns per row. Each chunk runs the same vectorised checks:
+
+- required fields are present,
+- attributes are numbers within ``ATTRIBUTE_RANGE``,
+- positions are known codes, and goalkeeping attributes fit the position,
+
+and once every chunk is read the keys are checked for players listed twice or
+at more than one club. An import can then be diffed against an earlier one by
+per-row hashes.
+
+``analyse`` only reads: results are memoised in-process by content hash, and
+the page keeps each visitor's previous upload in their session to diff
+against. ``python player_data.py FILE`` (``validate``) diffs against the last
+import of the same dataset and caches reports by ``(dataset, content hash)``
+under ``PORTFOLIO_PLAYER_DATA`` (default ``.player_data``), so re-validating an
+unchanged file only hashes it.
+"""
+
+import argparse
+import hashlib
+import os
+import pickle
+import re
+import sys
+import threading
+import warnings
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
+
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+
+import atomic
+import perf
+
+STATE_DIR = os.environ.get("PORTFOLIO_PLAYER_DATA", ".player_data")
+CHUNK_ROWS = int(os.environ.get("PORTFOLIO_PLAYER_CHUNK_ROWS", 50_000))
+REQUIRED = ["player_id", "name", "club", "position"]
+# Descriptive columns that are neither required nor attributes.
+OPTIONAL = ["nationality", "date_of_birth"]
+ATTRIBUTE_RANGE = (1, 20)
+POSITIONS = {"GK", "DL", "DC", "DR", "WBL", "WBR", "DM", "ML", "MC", "MR", "AML", "AMC", "AMR", "ST"}
+GOALKEEPING = ["aerial_reach", "command_of_area", "handling", "one_on_ones", "reflexes"]
+# Goalkeepers average at least this on their goalkeeping attributes, outfield players below it.
+GOALKEEPER_THRESHOLD = 10
+MAX_SAMPLES = 50
+HASH_BLOCK = 1024 * 1024
+# Analysed files kept in-process, each holding its report and key snapshot.
+CACHE_ENTRIES = 4
+
+RULES = {
+    "missing": "Required field is empty",
+    "range": f"Attribute is not a number from {ATTRIBUTE_RANGE[0]} to {ATTRIBUTE_RANGE[1]}",
+    "position": "Unknown position code",
+    "goalkeeping": "Goalkeeping attributes don't match the position",
+    "duplicate": "Player listed more than once at the same club",
+    "club_conflict": "Player listed at more than one club",
+}
+
+_lock = threading.Lock()
+_digests = {}
+_analyses = OrderedDict()
+
+
+class PlayerDataError(ValueError):
+    pass
+
+
+@dataclass
+class Report:
+    sha256: str
+    dataset: str = None
+    rows: int = 0
+    chunks: int = 0
+    attributes: tuple = ()
+    issues: dict = field(default_factory=lambda: dict.fromkeys(RULES, 0))
+    samples: pd.DataFrame = None
+    diff: dict = None
+    diff_samples: pd.DataFrame = None
+
+    @property
+    def clean(self):
+        return not any(self.issues.values())
+
+
+def _is_parquet(name):
+    return name.lower().endswith(".parquet")
+
+
+def content_hash(source):
+    """SHA-256 of a path or binary file object, read in blocks."""
+    if isinstance(source, str):
+        stat = os.stat(source)
+        key = (source, stat.st_mtime_ns, stat.st_size)
+        with _lock:
+            digest = _digests.get(key)
+        if digest is None:
+            with open(source, "rb") as handle:
+                digest = content_hash(handle)
+            with _lock:
+                _digests[key] = digest
+        return digest
+
+    digest = hashlib.sha256()
+    source.seek(0)
+    for block in iter(lambda: source.read(HASH_BLOCK), b""):
+        digest.update(block)
+    source.seek(0)
+    return digest.hexdigest()
+
+
+def read_chunks(source, name, chunk_rows=CHUNK_ROWS):
+    """Yield the dataset as string-typed frames of at most ``chunk_rows`` rows."""
+    if _is_parquet(name):
+        for batch in pq.ParquetFile(source).iter_batches(batch_size=chunk_rows):
+            yield batch.to_pandas().astype("string")
+    else:
+        # Everything is read as text so row hashes don't depend on per-chunk dtype inference.
+        yield from pd.read_csv(source, dtype="string", chunksize=chunk_rows, skipinitialspace=True)
+
+
+def _normalise(chunk):
+    chunk = chunk.rename(columns=lambda column: column.strip().lower().replace(" ", "_"))
+    missing = [column for column in REQUIRED if column not in chunk]
+    if missing:
+        raise PlayerDataError(f"missing columns: {', '.join(missing)}")
+    return chunk
+
+
+def _issues(rule, rows, player_ids, details):
+    return pd.DataFrame({"row": rows, "player_id": player_ids, "rule": rule, "detail": details})
+
+
+def check_chunk(chunk, attributes, first_row):
+    """Per-row rule violations in ``chunk``, one row per violation."""
+    rows = np.arange(first_row, first_row + len(chunk))
+    player_ids = chunk["player_id"].to_numpy(dtype=object)
+    found = []
+
+    required = chunk[REQUIRED]
+    empty = (required.isna() | required.apply(lambda column: column.str.strip() == "")).to_numpy(dtype=bool)
+    row_index, column_index = np.nonzero(empty)
+    found.append(_issues("missing", rows[row_index], player_ids[row_index], np.array(REQUIRED)[column_index]))
+
+    values = None
+    if attributes:
+        raw = chunk[list(attributes)]
+        values = raw.apply(pd.to_numeric, errors="coerce").to_numpy(dtype="float64")
+        low, high = ATTRIBUTE_RANGE
+        with np.errstate(invalid="ignore"):
+            bad = (values < low) | (values > high) | (np.isnan(values) & raw.notna().to_numpy())
+        row_index, column_index = np.nonzero(bad)
+        details = (np.array(attributes, dtype=object)[column_index] + "="
+                   + raw.to_numpy(dtype=object)[row_index, column_index])
+        found.append(_issues("range", rows[row_index], player_ids[row_index], details))
+
+    codes = chunk["position"].str.upper().str.replace(" ", "", regex=False).str.split(r"[/,]", regex=True)
+    exploded = codes.explode()
+    unknown = exploded.notna() & ~exploded.isin(POSITIONS)
+    bad_rows = np.flatnonzero(unknown.groupby(level=0, sort=False).any().reindex(chunk.index).to_numpy())
+    found.append(_issues("position", rows[bad_rows], player_ids[bad_rows], chunk["position"].to_numpy(dtype=object)[bad_rows]))
+
+    keepers = [attributes.index(column) for column in GOALKEEPING if column in attributes]
+    if keepers:
+        with np.errstate(invalid="ignore"), warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)  # all-empty rows average to NaN
+            score = np.nanmean(values[:, keepers], axis=1)
+        is_goalkeeper = (codes.str[0] == "GK").fillna(False).to_numpy(dtype=bool)
+        wrong = ~np.isnan(score) & (is_goalkeeper != (score >= GOALKEEPER_THRESHOLD))
+        details = np.where(is_goalkeeper, "GK", "outfield") + np.char.mod(" averaging %.1f", score)
+        found.append(_issues("goalkeeping", rows[wrong], player_ids[wrong], details[wrong]))
+
+    return pd.concat(found, ignore_index=True)
+
+
+def _row_keys(chunk, first_row):
+    # Only ids and 64-bit hashes are kept across chunks.
+    return pd.DataFrame({
+        "row": np.arange(first_row, first_row + len(chunk)),
+        "player_id": chunk["player_id"].str.strip().to_numpy(dtype=object),
+        "club": pd.util.hash_pandas_object(chunk["club"].str.strip().str.casefold(), index=False).to_numpy(),
+        "row_hash": pd.util.hash_pandas_object(chunk, index=False).to_numpy(),
+    })
+
+
+def check_duplicates(keys):
+    """Players appearing on several rows, as duplicates or as club conflicts."""
+    keys = keys[keys["player_id"].notna()]
+    repeated = keys[keys.duplicated("player_id", keep=False)]
+    if repeated.empty:
+        return _issues("duplicate", [], [], [])
+    clubs = repeated.groupby("player_id", sort=False)["club"].transform("nunique").to_numpy()
+    later = repeated.duplicated("player_id", keep="first").to_numpy()
+    conflict = later & (clubs > 1)
+    duplicate = later & (clubs == 1)
+    return pd.concat([
+        _issues("duplicate", repeated["row"][duplicate], repeated["player_id"][duplicate], "same club"),
+        _issues("club_conflict", repeated["row"][conflict], repeated["player_id"][conflict], "another club"),
+    ], ignore_index=True)
+
+
+def diff_snapshots(previous, current):
+    """Added, removed and changed players between two ``player_id``/``row_hash`` frames."""
+    merged = previous.merge(current, on="player_id", how="outer", suffixes=("_old", "_new"), indicator=True)
+    status = np.select(
+        [merged["_merge"] == "right_only", merged["_merge"] == "left_only",
+         merged["row_hash_old"] != merged["row_hash_new"]],
+        ["added", "removed", "changed"], default="unchanged")
+    changes = pd.DataFrame({"player_id": merged["player_id"], "change": status})
+    counts = changes["change"].value_counts().reindex(["added", "removed", "changed", "unchanged"], fill_value=0)
+    changes = changes[changes["change"] != "unchanged"]
+    return {name: int(count) for name, count in counts.items()}, changes.groupby("change").head(MAX_SAMPLES)
+
+
+def _dataset_name(name):
+    return re.sub(r"[^A-Za-z0-9_-]+", "_", os.path.splitext(os.path.basename(name))[0]) or "players"
+
+
+def _paths(dataset, sha256):
+    return (os.path.join(STATE_DIR, "reports", dataset, f"{sha256}.pickle"),
+            os.path.join(STATE_DIR, "snapshots", f"{dataset}.parquet"))
+
+
+def _dump(report, path):
+    with open(path, "wb") as handle:
+        pickle.dump(report, handle)
+
+
+def analyse(source, name, chunk_rows=CHUNK_ROWS):
+    """Validate a path or binary file object without diffing or writing anything.
+
+    Returns ``(report, snapshot)``, where ``snapshot`` is the ``player_id`` /
+    ``row_hash`` frame to diff later imports against. Results are kept
+    in-process by content hash, so re-checking the same bytes is a lookup.
+    """
+    sha256 = content_hash(source)
+    key = (sha256, _is_parquet(name), chunk_rows)
+    with _lock:
+        cached = _analyses.get(key)
+        if cached is not None:
+            _analyses.move_to_end(key)
+            perf.count("player_data.hit")
+            return cached
+    perf.count("player_data.miss")
+
+    report = Report(sha256)
+    samples, keys = [], []
+    with perf.span("player_data.validate"):
+        for chunk in read_chunks(source, name, chunk_rows):
+            chunk = _normalise(chunk)
+            if not report.chunks:
+                report.attributes = tuple(column for column in chunk if column not in REQUIRED + OPTIONAL)
+            found = check_chunk(chunk, report.attributes, report.rows)
+            for rule, count in found["rule"].value_counts().items():
+                report.issues[rule] += int(count)
+            samples.append(found.groupby("rule").head(MAX_SAMPLES))
+            keys.append(_row_keys(chunk, report.rows))
+            report.rows += len(chunk)
+            report.chunks += 1
+        if not report.chunks:
+            raise PlayerDataError(f"{name} has no rows")
+
+        keys = pd.concat(keys, ignore_index=True)
+        found = check_duplicates(keys)
+        for rule, count in found["rule"].value_counts().items():
+            report.issues[rule] += int(count)
+        samples.append(found.groupby("rule").head(MAX_SAMPLES))
+        report.samples = (pd.concat(samples, ignore_index=True).groupby("rule").head(MAX_SAMPLES)
+                          .sort_values("row", ignore_index=True))
+        snapshot = keys[["player_id", "row_hash"]].drop_duplicates("player_id", keep="last")
+
+    with _lock:
+        _analyses[key] = (report, snapshot)
+        while len(_analyses) > CACHE_ENTRIES:
+            _analyses.popitem(last=False)
+    return report, snapshot
+
+
+def compare(report, snapshot, previous):
+    """``report`` with the diff against the ``previous`` snapshot filled in (unchanged if there is none)."""
+    if previous is None:
+        return report
+    diff, diff_samples = diff_snapshots(previous, snapshot)
+    return replace(report, diff=diff, diff_samples=diff_samples)
+
+
+def validate(path, dataset=None, chunk_rows=CHUNK_ROWS):
+    """Validate the file at ``path`` and diff it against the dataset's previous import.
+
+    ``dataset`` (default: derived from the file name) identifies the series of
+    imports being diffed. Reports are kept on disk by ``(dataset, sha256)``.
+    """
+    dataset = dataset or _dataset_name(path)
+    report_path, snapshot_path = _paths(dataset, content_hash(path))
+    try:
+        with open(report_path, "rb") as handle:
+            report = pickle.load(handle)
+        perf.count("player_data.disk_hit")
+        return report
+    except (OSError, pickle.UnpicklingError, EOFError):
+        pass
+
+    report, snapshot = analyse(path, path, chunk_rows)
+    try:
+        previous = pd.read_parquet(snapshot_path)
+    except (OSError, ValueError):
+        previous = None
+    report = replace(compare(report, snapshot, previous), dataset=dataset)
+
+    atomic.write(snapshot_path, lambda tmp: snapshot.to_parquet(tmp, index=False))
+    atomic.write(report_path, lambda tmp: _dump(report, tmp))
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Validate a player/attribute import.")
+    parser.add_argument("path", help="CSV or Parquet file")
+    parser.add_argument("--dataset", help="name of the import series to diff against (default: file name)")
+    args = parser.parse_args(argv)
+    try:
+        report = validate(args.path, dataset=args.dataset)
+    except PlayerDataError as error:
+        sys.exit(f"{args.path}: {error}")
+
+    print(f"{report.rows:,} rows in {report.chunks} chunk(s), {len(report.attributes)} attributes")
+    for rule, count in report.issues.items():
+        print(f"  {RULES[rule]}: {count:,}")
+    if report.diff is not None:
+        print("  vs previous import: " + ", ".join(f"{count:,} {change}" for change, count in report.diff.items()))
+    return 0 if report.clean else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
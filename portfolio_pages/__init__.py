@@ -0,0 +1,55 @@
+"""Page registry for the sidebar navigation.
+
+Each sidebar entry lives in its own module and is imported the first time a
+visitor navigates to it, so text-only pages never pay for pandas, matplotlib or
+yfinance. ``warm_up`` preloads the heavy modules on a background thread once the
+server has painted its first page.
+"""
+
+import importlib
+import os
+import threading
+
+PAGES = {
+    "Home": "portfolio_pages.home",
+    "My Journey": "portfolio_pages.journey",
+    "Projects": "portfolio_pages.projects",
+    "Experiences": "portfolio_pages.experiences",
+    "Skills": "portfolio_pages.skills",
+    "Career Development": "portfolio_pages.career_development",
+    "Reflections": "portfolio_pages.reflections",
+}
+
+# Imported in this order by the warm-up thread; page modules pull in the rest.
+WARM_UP_MODULES = ["pandas", "matplotlib", "yfinance", "portfolio_pages.projects"]
+
+_warm_up_lock = threading.Lock()
+_warm_up_started = False
+
+
+def load(label):
+    """Return the page module for a sidebar label, importing it on first use."""
+    return importlib.import_module(PAGES[label])
+
+
+def _preload(modules):
+    for name in modules:
+        try:
+            importlib.import_module(name)
+        except ImportError:
+            pass
+
+
+def warm_up(modules=WARM_UP_MODULES):
+    """Start preloading ``modules`` in the background, once per process.
+
+    Disabled with ``PORTFOLIO_WARMUP=0``.
+    """
+    global _warm_up_started
+    if os.environ.get("PORTFOLIO_WARMUP", "1") == "0":
+        return
+    with _warm_up_lock:
+        if _warm_up_started:
+            return
+        _warm_up_started = True
+    threading.Thread(target=_preload, args=(list(modules),), name="page-warm-up", daemon=True).start()
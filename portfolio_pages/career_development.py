@@ -0,0 +1,7 @@
+import content
+
+
+def render():
+    content.render_section("career_development")
+    # ------------------- Class Reflection Section ------------------- #
+    content.render_section("class_reflections")
@@ -0,0 +1,54 @@
+import streamlit as st
+
+import content
+
+
+def display_player_validation():
+    st.markdown("### ⚽ Player Data Validation")
+    st.write("The checks behind my Sports Interactive research: upload a player/attribute export "
+             "to validate ranges, positions and club affiliations and compare it with the previous import.")
+    upload = st.file_uploader("Player data (CSV or Parquet)", type=["csv", "parquet"], key="player-data")
+    if upload is None:
+        return
+
+    # Imported on upload only: pandas and pyarrow would otherwise slow every cold load of this page.
+    import player_data
+
+    try:
+        report, snapshot = player_data.analyse(upload, upload.name)
+    except ValueError as error:  # PlayerDataError, or a file that can't be parsed
+        st.error(f"Could not validate {upload.name}: {error}")
+        return
+    # Uploads are only diffed against this visitor's previous upload and never written to disk.
+    sha256, current, previous = st.session_state.get("player-data-imports", (None, None, None))
+    if sha256 != report.sha256:
+        previous = current
+        st.session_state["player-data-imports"] = (report.sha256, snapshot, previous)
+    report = player_data.compare(report, snapshot, previous)
+
+    col1, col2, col3 = st.columns(3)
+    col1.metric("Rows", f"{report.rows:,}")
+    col2.metric("Attributes", len(report.attributes))
+    col3.metric("Issues", f"{sum(report.issues.values()):,}")
+
+    issues = {"Check": [player_data.RULES[rule] for rule in report.issues], "Rows": list(report.issues.values())}
+    st.dataframe(issues, hide_index=True, use_container_width=True)
+    if not report.clean:
+        st.markdown(f"**Examples** (up to {player_data.MAX_SAMPLES} per check)")
+        st.dataframe(report.samples, hide_index=True, use_container_width=True)
+
+    if report.diff is None:
+        st.caption("Upload a newer export of the same data to see what changed.")
+        return
+    st.markdown("**Changes since the previous import**")
+    col1, col2, col3 = st.columns(3)
+    col1.metric("Added", f"{report.diff['added']:,}")
+    col2.metric("Removed", f"{report.diff['removed']:,}")
+    col3.metric("Changed", f"{report.diff['changed']:,}")
+    if not report.diff_samples.empty:
+        st.dataframe(report.diff_samples, hide_index=True, use_container_width=True)
+
+
+def render():
+    content.render_section("experiences")
+    display_player_validation()
@@ -0,0 +1,36 @@
+import os
+
+import streamlit as st
+
+import assets
+
+PROFILE_PICTURE = "Taher_picture.PNG"
+
+
+def render():
+    col1, col2 = st.columns([2, 1])
+    with col1:
+        st.title("Hi, I am Taher 👋")
+        st.markdown("""
+        ## A Sophomore at the University of Richmond majoring in Business Administration with a concentration in Finance and Business Analytics
+
+        I was born in Palestine 🇵🇸, raised in Dubai for 14 years, and then immigrated to the United States four and a half years ago. I completed high school in Oklahoma, spent my freshman year at the University of Oklahoma, and then transferred to the University of Richmond — where I’m now in my second semester.
+
+        Outside the classroom, I'm passionate about soccer ⚽ — I follow leagues and players from every corner of the world. I’m proud to contribute to the Palestinian national football team by collecting and visualizing performance data.
+
+        Professionally, I’m keeping my doors open across finance — whether that’s investment banking, wealth management, or quant finance. My goal is to gain experience in the U.S. for the next 5–6 years, then return to Palestine and contribute to rebuilding and growing its economy during these difficult times.
+
+        [Learn More by going to my LinkedIn ➤ ](https://www.linkedin.com/in/taher-hijjaz)
+        """)
+    with col2:
+        # The picture is not checked in everywhere; keep the page rendering without it.
+        if os.path.isfile(PROFILE_PICTURE):
+            st.image(assets.image(PROFILE_PICTURE, 1 / 3), caption="Taher Hijjaz", use_container_width=True)
+        else:
+            st.caption("Taher Hijjaz")
+
+    st.markdown("---")
+    st.markdown("### 🌍 My Global Journey")
+    map_data = {"lat": [31.9522, 25.276987, 35.4676, 37.5407], "lon": [35.2332, 55.296249, -97.5164, -77.4360]}
+    st.map(map_data)
+    st.caption("Journey path from Palestine → Dubai → Oklahoma → Richmond")
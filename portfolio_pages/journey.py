@@ -0,0 +1,23 @@
+import streamlit as st
+
+import assets
+import downloads
+
+
+def render():
+    st.markdown("## 📘 My Journey")
+    col1, col2 = st.columns([2, 1])
+    with col1:
+        st.markdown("""
+        I began my undergraduate studies at the University of Oklahoma, where I pursued rigorous courses such as Intermediate Financial Accounting and Microeconomic Theory. During my time there, I served as the Financial Controller for the Afghan Student Association, overseeing financial planning for events, collaborating cross-functionally, and forecasting budget allocations.
+
+        However, by the end of my freshman year, I realized that remaining at the University of Oklahoma would not fully support my career aspiration of breaking into Wall Street. As a result, I transferred to the University of Richmond, an institution known for its academic rigor and emphasis on developing both technical and soft skills.
+
+        Since transferring, I have significantly strengthened my technical foundation in finance through courses such as Corporate Finance, Investments, and Fixed Income/Derivatives. I have also enhanced my analytical abilities by taking courses in Data Analysis Software and Machine Learning. Beyond the classroom, I am actively engaged on campus as President of the Arab Student Association and as a consultant for the Lakeside Consulting Group, a student-run organization.
+
+        Outside of academia, I serve as an Assistant Researcher for Sports Interactive, where I analyze and validate player metrics and collaborate with others to ensure accurate data for soccer clubs and players.
+        """)
+    with col2:
+        st.image(assets.image("images_journey.png", 1 / 3), use_container_width=True, caption="Journey from Oklahoma to Richmond")
+
+    downloads.button("resume")
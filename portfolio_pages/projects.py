@@ -0,0 +1,313 @@
+import os
+
+import streamlit as st
+
+import analytics
+import assets
+import chart_cache
+import client_chart
+import downloads
+import event_study
+import market_data
+import match_events
+import perf
+import refresher
+import valuation
+
+# (display name, ticker, research date) for every covered equity report
+COVERAGE = [
+    ("Nike", "NKE", "2025-02-17"),
+    ("Costco", "COST", "2025-02-10"),
+    ("TSMC", "TSM", "2025-02-23"),
+]
+REPORT_DOWNLOADS = {"Nike": "nike_teaser", "Costco": "costco_report", "TSMC": "tsm_report"}
+# Starting point of each valuation model, in line with the company's recent growth and FCF margin.
+VALUATION_DEFAULTS = {
+    "NKE": valuation.Assumptions(growth_mean=0.03, growth_sd=0.03, margin_mean=0.10, margin_sd=0.02,
+                                 wacc_mean=0.085, wacc_sd=0.01),
+    "COST": valuation.Assumptions(growth_mean=0.07, growth_sd=0.02, margin_mean=0.03, margin_sd=0.005,
+                                  wacc_mean=0.075, wacc_sd=0.0075),
+    "TSM": valuation.Assumptions(growth_mean=0.15, growth_sd=0.05, margin_mean=0.30, margin_sd=0.05,
+                                 wacc_mean=0.095, wacc_sd=0.01),
+}
+BENCHMARK = "SPY"
+LIVE_INTERVAL = int(os.environ.get("PORTFOLIO_LIVE_SECONDS", 60))
+# "png" rasterises charts on the server, "client" draws them in the browser.
+CHART_BACKEND = os.environ.get("PORTFOLIO_CHART_BACKEND", "png")
+COMPARISON_START = min(start for _, _, start in COVERAGE)
+SENSITIVITY_WACC = [0.07, 0.08, 0.09, 0.10, 0.11]
+SENSITIVITY_GROWTH = [0.015, 0.02, 0.025, 0.03, 0.035]
+
+
+def display_stock_metrics(name, ticker_symbol, start_date, snapshot, interactive=False):
+    st.metric(label=f"{name} Return (since {start_date})", value=f"${snapshot.latest_price:.2f}",
+              delta=f"{snapshot.pct_change:+.2f}%")
+    st.caption(refresher.freshness(snapshot))
+    if interactive:
+        frame = client_chart.chart_frame(ticker_symbol, start_date, snapshot.hist)
+        with perf.span("stock.vega_lite"):
+            st.vega_lite_chart(frame, client_chart.spec(f"{ticker_symbol} – Since {start_date}"),
+                               use_container_width=True)
+        return
+    with perf.span("stock.chart"):
+        png = chart_cache.close_chart_png(ticker_symbol, start_date, snapshot.hist)
+    with perf.span("stock.st_image"):
+        st.image(png, use_container_width=True)
+
+
+@st.fragment(run_every=LIVE_INTERVAL)
+def live_stock_metrics(name, ticker_symbol, start_date, interactive=False):
+    # Only this fragment reruns on the timer; it appends the newest bars to the
+    # series kept in the session instead of rereading the whole history.
+    key = f"live-{ticker_symbol}-{start_date}"
+    snapshot = st.session_state.get(key) or refresher.get(ticker_symbol, start_date)
+    since = snapshot.hist.index[-1].strftime("%Y-%m-%d")
+    with perf.span("stock.live_fetch"):
+        newest = market_data.fetch_since(ticker_symbol, since, max_age=LIVE_INTERVAL)
+    snapshot = refresher.extend(snapshot, newest, refresher.synced_at(ticker_symbol))
+    st.session_state[key] = snapshot
+    display_stock_metrics(name, ticker_symbol, start_date, snapshot, interactive)
+
+
+def _assumptions(ticker_symbol):
+    d = VALUATION_DEFAULTS.get(ticker_symbol, valuation.Assumptions())
+    around = lambda mean, sd: (round(mean - sd, 6), round(mean + sd, 6))
+    col1, col2 = st.columns(2)
+    with col1:
+        growth = st.slider("Revenue growth", -0.10, 0.25, around(d.growth_mean, d.growth_sd),
+                           0.005, format="%.3f", key=f"val-growth-{ticker_symbol}",
+                           help="Mean ± one standard deviation of annual revenue growth.")
+        margin = st.slider("FCF margin", 0.0, 0.40, around(d.margin_mean, d.margin_sd),
+                           0.005, format="%.3f", key=f"val-margin-{ticker_symbol}")
+    with col2:
+        wacc = st.slider("WACC", 0.04, 0.15, around(d.wacc_mean, d.wacc_sd),
+                         0.0025, format="%.4f", key=f"val-wacc-{ticker_symbol}")
+        terminal_growth = st.slider("Terminal growth", 0.0, 0.04, d.terminal_growth, 0.0025, format="%.4f",
+                                    key=f"val-tg-{ticker_symbol}")
+    # Rounded so that float noise from the sliders doesn't defeat the caches.
+    mean_sd = lambda bounds: (round(sum(bounds) / 2, 6), round((bounds[1] - bounds[0]) / 2, 6))
+    (growth_mean, growth_sd), (margin_mean, margin_sd), (wacc_mean, wacc_sd) = map(mean_sd, (growth, margin, wacc))
+    return valuation.Assumptions(growth_mean, growth_sd, margin_mean, margin_sd, wacc_mean, wacc_sd,
+                                 round(terminal_growth, 6))
+
+
+@st.fragment
+def valuation_panel(name, ticker_symbol, price):
+    # A fragment, so moving a slider only reruns the model, not the page.
+    if not st.toggle("Valuation model", key=f"val-{ticker_symbol}",
+                     help="Monte Carlo DCF of fair value per share against the latest price."):
+        return
+    fields = market_data.fundamentals(ticker_symbol)
+    if fields is None:
+        st.info(f"Fundamentals for {name} are not available right now.")
+        return
+    fundamentals = valuation.Fundamentals(revenue=fields["totalRevenue"], shares=fields["sharesOutstanding"],
+                                          net_debt=fields["totalDebt"] - fields["totalCash"])
+    assumptions = _assumptions(ticker_symbol)
+
+    with perf.span("valuation.simulate"):
+        values = valuation.fair_values(assumptions, fundamentals)
+        stats = valuation.summary(values, price)
+    caption = f"{assumptions.draws:,} draws over {assumptions.years} years, latest price ${price:.2f}."
+    if fields["fx_rate"] != 1:
+        caption += f" Financials converted from {fields['financial_currency']} at {fields['fx_rate']:.4f}."
+    st.caption(caption)
+    col1, col2, col3 = st.columns(3)
+    col1.metric("Median fair value", f"${stats['P50']:.2f}", delta=f"{stats['P50'] / price - 1:+.1%}")
+    col2.metric("P5 – P95", f"${stats['P5']:.0f} – ${stats['P95']:.0f}")
+    col3.metric("P(fair value > price)", f"{stats['P(fair value > price)']:.0%}")
+
+    st.vega_lite_chart({
+        "height": 180,
+        "layer": [
+            {"data": {"values": valuation.histogram(values).to_dict("records")},
+             "mark": {"type": "bar", "opacity": 0.8},
+             "encoding": {"x": {"field": "Fair value", "type": "quantitative", "axis": {"format": "$.0f"}},
+                          "y": {"field": "Draws", "type": "quantitative"}}},
+            {"data": {"values": [{"price": price}]},
+             "mark": {"type": "rule", "color": "red", "strokeWidth": 2},
+             "encoding": {"x": {"field": "price", "type": "quantitative"}}},
+        ],
+    }, use_container_width=True)
+
+    st.markdown("**Fair value per share: WACC × terminal growth**")
+    with perf.span("valuation.sensitivity"):
+        grid = valuation.sensitivity(assumptions, fundamentals, SENSITIVITY_WACC, SENSITIVITY_GROWTH)
+    st.dataframe(grid.style.format("${:.2f}", na_rep="–"), use_container_width=True)
+
+
+# --- Helper function for historical stock display ---
+def display_historical_stock(name, ticker_symbol, start_date, live=False, interactive=False):
+    with perf.span("stock.snapshot"):
+        snapshot = refresher.get(ticker_symbol, start_date)
+
+    if snapshot is None:
+        st.warning(f"No historical data for {name} starting from {start_date}.")
+        return
+
+    col1, col2 = st.columns([1, 1], gap="medium")
+    with col1:
+        st.markdown(f"### {name} Stock Report")
+        st.write(f"Market performance since {start_date} and investment thesis.")
+        st.caption(f"**{name} Equity Research** | Taher Hijjaz")
+
+        if name in REPORT_DOWNLOADS:
+            downloads.button(REPORT_DOWNLOADS[name])
+
+    with col2:
+        if live:
+            live_stock_metrics(name, ticker_symbol, start_date, interactive)
+        else:
+            display_stock_metrics(name, ticker_symbol, start_date, snapshot, interactive)
+
+    valuation_panel(name, ticker_symbol, snapshot.latest_price)
+
+
+def display_coverage_comparison():
+    symbols = [symbol for _, symbol, _ in COVERAGE] + [BENCHMARK]
+    with perf.span("analytics.panel"):
+        closes = market_data.close_panel(symbols, COMPARISON_START)
+    if BENCHMARK not in closes or closes.shape[1] < 2:
+        st.info("The coverage comparison will appear once price data has loaded.")
+        return
+
+    with perf.span("analytics.compute"):
+        result = analytics.compute(closes, BENCHMARK)
+
+    st.markdown("### 📊 Research Coverage Comparison")
+    st.caption(f"Daily closes since {COMPARISON_START}, benchmarked against {BENCHMARK}.")
+    percent = "{:.1%}"
+    st.dataframe(result.metrics.style.format({
+        "Total Return": percent,
+        "Ann. Volatility": percent,
+        "Max Drawdown": percent,
+    }, precision=2), use_container_width=True)
+
+
+def display_event_study():
+    if not st.toggle("Event study", help=f"Abnormal returns of every research call against {BENCHMARK}."):
+        return
+    st.markdown("### 🎯 Research Call Event Study")
+    try:
+        with perf.span("event_study.study"):
+            result = event_study.study(BENCHMARK)
+    except event_study.CallsError as error:
+        st.error(f"Could not read the research calls: {error}")
+        return
+    if result is None or result.calls.empty:
+        st.info("The event study will appear once there are research calls with price data.")
+        return
+
+    windows = st.multiselect("Windows", list(event_study.WINDOWS), default=list(event_study.WINDOWS))
+    st.caption(f"{len(result.calls)} calls; returns from the event-day close, minus {BENCHMARK}, "
+               "signed by the call's direction.")
+    percent = "{:.1%}"
+    st.dataframe(result.summary.loc[windows].style.format({
+        "Hit rate": percent,
+        "Mean abnormal return": percent,
+        "Median abnormal return": percent,
+    }), use_container_width=True)
+
+    st.vega_lite_chart(result.car.reset_index(), {
+        "title": {"text": "Mean cumulative abnormal return", "fontSize": 12},
+        "height": 200,
+        "mark": {"type": "line", "strokeWidth": 1.5},
+        "encoding": {
+            "x": {"field": "Day", "type": "quantitative", "title": "Trading days after the call"},
+            "y": {"field": "Mean CAR", "type": "quantitative", "title": None, "axis": {"format": "%"}},
+            "tooltip": [{"field": "Day", "type": "quantitative"},
+                        {"field": "Mean CAR", "type": "quantitative", "format": ".2%"},
+                        {"field": "Calls", "type": "quantitative"}],
+        },
+    }, use_container_width=True)
+
+    calls = result.abnormal[["ticker", "date", "direction"] + windows]
+    st.dataframe(calls.style.format(percent, subset=windows, na_rep="–").format("{:%Y-%m-%d}", subset=["date"]),
+                 hide_index=True, use_container_width=True)
+
+
+def display_match_analysis():
+    version = match_events.data_version()
+    if not version:
+        return
+    events = match_events.load_events()
+
+    with st.expander("⚽ Explore the match data", expanded=False):
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            matches = st.multiselect("Matches", list(events["match_id"].cat.categories))
+        with col2:
+            event_types = st.multiselect("Event types", list(events["event_type"].cat.categories))
+        with col3:
+            team = st.selectbox("Team", list(events["team"].cat.categories))
+            players = events.loc[events["team"] == team, "player"].unique().tolist()
+            player = st.selectbox("Player", ["Whole team"] + sorted(players))
+
+        key = (version, tuple(sorted(matches)), tuple(sorted(event_types)))
+        result = match_events.analysis(*key)
+        if not result["events"]:
+            st.info("No events match these filters.")
+            return
+
+        col1, col2 = st.columns([1, 1], gap="medium")
+        with col1:
+            if player == "Whole team":
+                png = match_events.heatmap_png(*key, "team", team)
+            else:
+                png = match_events.heatmap_png(*key, "player", player)
+            st.image(png, use_container_width=True)
+        with col2:
+            edges, _ = result["passes"]
+            st.markdown("**Most frequent pass combinations**")
+            st.dataframe(edges.head(10), hide_index=True, use_container_width=True)
+        st.markdown("**Events by pitch zone**")
+        st.dataframe(result["zones"], use_container_width=True)
+
+
+def render():
+    st.markdown("## 🧠 Projects + Stock Performance")
+    st.caption("Charts and metrics since relevant research dates.")
+    live = st.toggle("Live prices", help=f"Refresh the stock metrics every {LIVE_INTERVAL} seconds without reloading the page.")
+    interactive = st.toggle("Interactive charts", value=CHART_BACKEND == "client",
+                            help="Draw the charts in the browser with zoom and hover.")
+
+    requests = [(symbol, start) for _, symbol, start in COVERAGE] + [(BENCHMARK, COMPARISON_START)]
+    try:
+        requests += event_study.requests(event_study.load_calls(), BENCHMARK)
+    except event_study.CallsError:
+        pass  # reported in the event-study section
+    refresher.start(requests)
+    for name, symbol, start in COVERAGE:
+        display_historical_stock(name, symbol, start, live, interactive)
+    display_coverage_comparison()
+    display_event_study()
+
+    # MGMT 225
+    st.markdown("### 4. MGMT 225 Final Report")
+    col1, col2 = st.columns([2, 1])
+    with col1:
+        st.write("Built a business intelligence dashboard and KPI model...")
+        downloads.button("mgmt225_report")
+    with col2:
+        st.image(assets.image("data_picture.jpeg", 1 / 3), caption="BI Dashboard Project", use_container_width=True)
+
+    # Palestine Football
+    st.markdown("### 5. Palestine National Team Analysis")
+    col1, col2 = st.columns([2, 1])
+    with col1:
+        st.write("Collected and visualized match data for the Palestinian team...")
+    with col2:
+        st.image(assets.image("pfa.png", 1 / 3), caption="Match Data Analysis", use_container_width=True)
+
+    downloads.button("palestine_analysis")
+    display_match_analysis()
+
+    # Small Business
+    st.markdown("### 6. Small Business Financial Analysis")
+    col1, col2 = st.columns([2, 1])
+    with col1:
+        st.write("Helped a Richmond business understand financials and cash flow...")
+    with col2:
+        st.image(assets.image("EPC.png", 1 / 3), caption="Financial Planning Presentation", use_container_width=True)
+
+    downloads.button("pep_house")
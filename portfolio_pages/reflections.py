@@ -0,0 +1,19 @@
+import streamlit as st
+
+
+def render():
+    st.markdown("## 🔁 Reflections")
+    st.markdown("### 🌍 Integrating Work & Life Purpose")
+
+    st.write("""
+My view of work is inseparable from my identity as a Muslim and a Palestinian. I see my career not simply as a way to earn a living, but as a vehicle to serve a larger purpose. To me, work is about maximizing opportunities — acquiring skills, building wealth, and gaining influence — so that I can reinvest those resources in rebuilding and supporting my community back home in Palestine.
+
+Faith and career aren't in conflict; in fact, my faith gives my career direction. Islam teaches that actions must serve humanity, uphold justice, and preserve dignity — values that guide every career decision I make. Whether I'm conducting financial analysis or leading a student organization, I’m always asking: *Will this contribute to something bigger than myself? Will it help others?* That sense of mission pushes me to work harder and with more intentionality every day.
+    """)
+
+    st.markdown("---")
+
+    st.markdown("### ✍️ Final Thought")
+    st.write("""
+I don’t view my goals in finance as separate from my identity or values — they are intertwined. I want to be the kind of professional who succeeds without compromising principles, and the kind of person who uses that success to uplift others. That’s what fulfillment looks like for me — not just a career, but a calling.
+    """)
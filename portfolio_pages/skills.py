@@ -0,0 +1,52 @@
+import streamlit as st
+
+
+def render():
+    st.markdown("## 🛠️ Skills & Certifications")
+
+    # --- Technical Skills ---
+    st.markdown("### ⚙️ Technical Skills")
+
+    col1, col2 = st.columns([1, 1])
+    with col1:
+        st.markdown("#### 💼 Finance & Analytics")
+        st.write("""
+- **Financial Modeling**: DCF, LBO, Comparable Company Analysis  
+- **Market Knowledge**: Derivatives, Fixed Income, Equities  
+- **Data Analysis**: Tableau, Excel (Advanced), Power BI
+        """)
+
+    with col2:
+        st.markdown("#### 🧠 Programming & Tools")
+        st.write("""
+- **Languages**: Python (Pandas, NumPy, Scikit-learn, Streamlit)  
+- **Visualization**: Matplotlib, Seaborn, Plotly  
+- **Version Control**: Git & GitHub
+        """)
+
+    st.markdown("---")
+
+    # --- Certifications ---
+    st.markdown("### 🎓 Certifications")
+    cert_cols = st.columns(3)
+
+    certs = {
+        "Bloomberg Market Concepts (BMC)": "📊",
+        "Citi Investment Banking Virtual Experience": "🏦",
+        "JPMorgan Quantitative Research Virtual Experience": "📈"
+    }
+
+    for (cert, emoji), col in zip(certs.items(), cert_cols):
+        with col:
+            st.markdown(f"{emoji} **{cert}**")
+
+    st.markdown("---")
+
+    # --- Soft Skills ---
+    st.markdown("### 💬 Interpersonal Skills")
+    st.write("""
+- Public speaking & presentation delivery  
+- Project management and team leadership  
+- Cross-cultural collaboration  
+- Adaptability and growth mindset
+    """)
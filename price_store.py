@@ -0,0 +1,117 @@
+"""On-disk daily price store shared by every Streamlit worker process.
+
+Each ticker is kept as one Parquet file plus a small JSON sidecar recording the
+earliest requested start date and the last sync time. Syncing only asks the
+upstream for the bars after the last stored date, and a per-ticker lock file
+makes sure only one process does that at a time. Files are swapped in with an
+atomic rename, so readers never need to take a lock.
+"""
+
+import json
+import os
+import time
+from contextlib import contextmanager
+
+import pandas as pd
+
+import atomic
+
+try:
+    import fcntl
+except ImportError:  # Windows: single-process deployments only
+    fcntl = None
+
+STORE_DIR = os.environ.get("PORTFOLIO_PRICE_STORE", ".price_store")
+SYNC_INTERVAL = int(os.environ.get("PORTFOLIO_PRICE_SYNC_SECONDS", 15 * 60))
+
+
+@contextmanager
+def _file_lock(path, blocking=True):
+    with open(path, "a+b") as handle:
+        if fcntl is None:
+            yield True
+            return
+        flags = fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB
+        try:
+            fcntl.flock(handle.fileno(), flags)
+        except BlockingIOError:
+            yield False
+            return
+        try:
+            yield True
+        finally:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+
+
+class PriceStore:
+    def __init__(self, root=STORE_DIR, sync_interval=SYNC_INTERVAL):
+        self.root = root
+        self.sync_interval = sync_interval
+        os.makedirs(root, exist_ok=True)
+
+    def _path(self, symbol, suffix):
+        return os.path.join(self.root, f"{symbol.upper()}{suffix}")
+
+    def meta(self, symbol):
+        try:
+            with open(self._path(symbol, ".json")) as handle:
+                return json.load(handle)
+        except (OSError, ValueError):
+            return None
+
+    def read(self, symbol, start_date=None):
+        """Return the stored bars for ``symbol`` from ``start_date`` on (empty if none)."""
+        try:
+            hist = pd.read_parquet(self._path(symbol, ".parquet"))
+        except (OSError, ValueError):
+            return pd.DataFrame()
+        return hist.loc[start_date:] if start_date else hist
+
+    def needs_sync(self, symbol, start_date, max_age=None):
+        meta = self.meta(symbol)
+        if meta is None or meta["start"] > start_date:
+            return True
+        max_age = self.sync_interval if max_age is None else max_age
+        return time.time() - meta["synced_at"] >= max_age
+
+    def sync(self, symbol, start_date, fetch, max_age=None):
+        """Bring ``symbol`` up to date, calling ``fetch(symbol, start)`` only for missing bars.
+
+        Data synced less than ``max_age`` seconds ago (default: the store's sync
+        interval) is left alone. Returns False when another process is already
+        syncing this ticker.
+        """
+        if not self.needs_sync(symbol, start_date, max_age):
+            return True
+        with _file_lock(self._path(symbol, ".lock"), blocking=False) as acquired:
+            if not acquired:
+                return False
+            # Another process may have finished a sync while we waited for the lock.
+            if not self.needs_sync(symbol, start_date, max_age):
+                return True
+
+            meta = self.meta(symbol)
+            stored = self.read(symbol)
+            if meta is None or stored.empty or meta["start"] > start_date:
+                # Backfill the whole range; the overlap is deduplicated below.
+                fetched = fetch(symbol, start_date)
+                requested_from = min(start_date, meta["start"]) if meta else start_date
+            else:
+                # Refetch the last stored bar too, it may have been an intraday partial.
+                fetched = fetch(symbol, stored.index[-1].strftime("%Y-%m-%d"))
+                requested_from = meta["start"]
+
+            if fetched.empty:
+                return True
+            merged = pd.concat([stored, fetched]) if not stored.empty else fetched
+            merged = merged[~merged.index.duplicated(keep="last")].sort_index()
+
+            atomic.write(self._path(symbol, ".parquet"), merged.to_parquet)
+            new_meta = {"start": requested_from, "synced_at": time.time()}
+            atomic.write(self._path(symbol, ".json"), lambda tmp: _write_json(tmp, new_meta))
+            return True
+
+
+def _write_json(path, data):
+    with open(path, "w") as handle:
+        json.dump(data, handle)
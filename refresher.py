@@ -0,0 +1,173 @@
+"""Background stale-while-revalidate refresher for the stock metrics.
+
+One daemon thread per server process refreshes every registered
+``(symbol, start_date)`` on a fixed interval. Page renders only read the latest
+snapshot, so they never wait on the upstream and upstream load does not grow
+with the number of open sessions.
+"""
+
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+import pandas as pd
+
+import market_data
+import perf
+from price_store import SYNC_INTERVAL
+
+REFRESH_INTERVAL = int(os.environ.get("PORTFOLIO_REFRESH_SECONDS", SYNC_INTERVAL))
+
+logger = logging.getLogger(__name__)
+
+_lock = threading.Lock()
+_requests = set()
+_snapshots = {}
+_thread = None
+_ready = threading.Event()
+_wake = threading.Event()
+_store_only = False
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    hist: object
+    latest_price: float
+    pct_change: float
+    updated_at: float
+
+    @property
+    def age(self):
+        return time.time() - self.updated_at
+
+
+def make_snapshot(hist, updated_at):
+    if hist.empty:
+        return None
+    with perf.span("pandas.snapshot"):
+        latest_price = float(hist["Close"].iloc[-1])
+        open_price = float(hist["Open"].iloc[0])
+        pct_change = ((latest_price - open_price) / open_price) * 100
+    return Snapshot(hist, latest_price, pct_change, updated_at)
+
+
+def extend(snapshot, newest, updated_at):
+    """Return ``snapshot`` with ``newest`` bars appended, replacing any bars they overlap."""
+    if newest.empty:
+        return snapshot
+    hist = snapshot.hist
+    hist = pd.concat([hist[hist.index < newest.index[0]], newest])
+    return make_snapshot(hist, updated_at)
+
+
+def synced_at(symbol):
+    meta = market_data.get_store().meta(symbol)
+    return meta["synced_at"] if meta else 0.0
+
+
+def format_age(seconds):
+    if seconds < 90:
+        return "just now"
+    if seconds < 90 * 60:
+        return f"{seconds / 60:.0f} min ago"
+    if seconds < 36 * 3600:
+        return f"{seconds / 3600:.0f} h ago"
+    return f"{seconds / 86400:.0f} days ago"
+
+
+def format_time(timestamp):
+    return time.strftime("%Y-%m-%d %H:%M %Z", time.localtime(timestamp))
+
+
+def freshness(snapshot):
+    """Caption for when ``snapshot`` was synced; absolute under ``store_only``, since exported pages never update."""
+    if _store_only:
+        return f"Prices as of {format_time(snapshot.updated_at)}"
+    return f"Updated {format_age(snapshot.age)}"
+
+
+def _fetch(requests):
+    try:
+        return market_data.fetch_histories(requests)
+    except Exception:
+        logger.exception("Batched price refresh failed, retrying one request at a time")
+    # One bad request must not keep the other tickers from refreshing.
+    histories = {}
+    for request in requests:
+        try:
+            histories.update(market_data.fetch_histories([request]))
+        except Exception:
+            logger.exception("Price refresh failed for %s", request)
+    return histories
+
+
+def refresh_now():
+    with _lock:
+        requests = list(_requests)
+    for (symbol, start_date), hist in _fetch(requests).items():
+        try:
+            # Age comes from the store so a failed refresh does not look fresh.
+            snapshot = make_snapshot(hist, synced_at(symbol))
+        except Exception:
+            logger.exception("Price snapshot failed for %s", symbol)
+            continue
+        if snapshot is not None:
+            with _lock:
+                _snapshots[(symbol, start_date)] = snapshot
+
+
+def _run(interval):
+    while True:
+        try:
+            refresh_now()
+        except Exception:
+            logger.exception("Price refresh failed")
+        finally:
+            # Even after a failure, pages stop waiting and serve what the store has.
+            _ready.set()
+        _wake.wait(interval)
+        _wake.clear()
+
+
+@contextmanager
+def store_only():
+    """Serve snapshots straight from the price store and never start the thread, e.g. for the static export."""
+    global _store_only
+    _store_only = True
+    try:
+        yield
+    finally:
+        _store_only = False
+
+
+def start(requests, interval=REFRESH_INTERVAL):
+    """Register ``(symbol, start_date)`` pairs and start the refresher if it is not running."""
+    global _thread
+    if _store_only:
+        return
+    with _lock:
+        new = set(requests) - _requests
+        _requests.update(new)
+        if _thread is None:
+            _thread = threading.Thread(target=_run, args=(interval,), name="price-refresher", daemon=True)
+            _thread.start()
+        elif new:
+            _wake.set()
+
+
+def get(symbol, start_date, timeout=market_data.PAGE_DEADLINE):
+    """Return the latest snapshot for ``(symbol, start_date)``, or None if there is no data."""
+    if _store_only:
+        return make_snapshot(market_data.get_store().read(symbol, start_date), synced_at(symbol))
+    with _lock:
+        snapshot = _snapshots.get((symbol, start_date))
+    if snapshot is None:
+        # Not refreshed yet in this process: serve what the shared store already has.
+        snapshot = make_snapshot(market_data.get_store().read(symbol, start_date), synced_at(symbol))
+    if snapshot is None and _ready.wait(timeout):
+        with _lock:
+            snapshot = _snapshots.get((symbol, start_date))
+    return snapshot